@@ -0,0 +1,141 @@
+"""
+Shared job state for the Website Generator.
+
+This module keeps live job progress in Redis so every API worker sees the
+same status while a job runs. PostgreSQL remains the source of truth; the
+Redis entries are a short-lived fast path for status polling.
+"""
+
+import hashlib
+import logging
+import os
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+import orjson
+import redis.asyncio as redis
+from redis.asyncio.client import PubSub
+
+
+logger = logging.getLogger(__name__)
+
+# Job state is only needed while a job runs and shortly after it finishes
+JOB_TTL_SECONDS = 3600
+
+# Jobs the worker runs at once, and how many may be queued or running before
+# /generate starts turning new URLs away
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_LIMIT = int(os.getenv("JOB_QUEUE_LIMIT") or JOB_WORKERS * 2)
+
+
+class JobStore:
+    """Redis-backed store for in-flight job state."""
+
+    def __init__(self):
+        self.redis: Optional[redis.Redis] = None
+        self.redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
+
+    async def connect(self):
+        """Create the Redis connection pool."""
+        self.redis = redis.from_url(self.redis_url, decode_responses=True)
+        logger.debug("Redis connection pool established")
+
+    async def disconnect(self):
+        """Close the Redis connection pool."""
+        if self.redis:
+            await self.redis.aclose()
+            logger.debug("Redis connection pool closed")
+
+    @staticmethod
+    def _key(job_id: UUID) -> str:
+        return f"job:{job_id}"
+
+    @staticmethod
+    def _channel(job_id: UUID) -> str:
+        return f"job:{job_id}:events"
+
+    @staticmethod
+    def _inflight_key(url: str) -> str:
+        return f"inflight:{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+
+    @staticmethod
+    def decode(fields: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """Turn stored empty strings back into None."""
+        return {name: value or None for name, value in fields.items()}
+
+    async def set_job(self, job_id: UUID, **fields: Any):
+        """
+        Merge fields into the job's state, refresh its TTL and notify subscribers.
+
+        None values are stored as empty strings, since Redis hashes only hold strings.
+        The changed fields are published on the job's channel as JSON.
+        """
+        mapping = {name: "" if value is None else str(value) for name, value in fields.items()}
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(self._key(job_id), mapping=mapping)
+                pipe.expire(self._key(job_id), JOB_TTL_SECONDS)
+                pipe.publish(self._channel(job_id), orjson.dumps(mapping))
+                await pipe.execute()
+        except redis.RedisError:
+            logger.exception("Failed to store state for job %s", job_id)
+
+    async def get_job(self, job_id: UUID) -> Optional[Dict[str, Optional[str]]]:
+        """Get the job's state, or None if it is not tracked (or Redis is unavailable)."""
+        try:
+            fields = await self.redis.hgetall(self._key(job_id))
+        except redis.RedisError:
+            logger.exception("Failed to read state for job %s", job_id)
+            return None
+        if not fields:
+            return None
+        return self.decode(fields)
+
+    async def get_inflight_job(self, url: str) -> Optional[UUID]:
+        """Get the ID of the job currently processing this URL, if any."""
+        try:
+            job_id = await self.redis.get(self._inflight_key(url))
+        except redis.RedisError:
+            logger.exception("Failed to read in-flight job for %s", url)
+            return None
+        return UUID(job_id) if job_id else None
+
+    async def claim_url(self, url: str, job_id: UUID) -> Optional[UUID]:
+        """
+        Register the job as the one processing this URL.
+
+        Returns None if the job now owns the URL, otherwise the ID of the job
+        that already does. Uses a single SET NX GET, so concurrent claims from
+        different API workers cannot both win.
+        """
+        try:
+            owner = await self.redis.set(
+                self._inflight_key(url), str(job_id), nx=True, get=True, ex=JOB_TTL_SECONDS
+            )
+        except redis.RedisError:
+            logger.exception("Failed to claim in-flight URL %s", url)
+            return None
+        return UUID(owner) if owner else None
+
+    async def release_url(self, url: str, job_id: UUID):
+        """Release the URL if this job still owns it."""
+        key = self._inflight_key(url)
+        try:
+            if await self.redis.get(key) == str(job_id):
+                await self.redis.delete(key)
+        except redis.RedisError:
+            logger.exception("Failed to release in-flight URL %s", url)
+
+    async def subscribe(self, job_id: UUID) -> PubSub:
+        """
+        Subscribe to the job's update channel; the caller must aclose() the result.
+
+        Subscribe before reading the current state so no update published in
+        between is missed. Messages carry the changed fields as JSON.
+        """
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self._channel(job_id))
+        return pubsub
+
+# Global job store instance
+job_store = JobStore()
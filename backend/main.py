@@ -6,27 +6,54 @@ handles async processing, and serves the web interface.
 """
 
 import asyncio
+import gzip
+import hashlib
+import html
+import logging
+import mimetypes
 import os
+import re
+import time
 from datetime import datetime
+from contextlib import aclosing
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple, Union
+from uuid import UUID
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse, JSONResponse
+# Prefer uvloop's libuv-based event loop when it is installed; asyncpg's
+# socket I/O benefits most. uvicorn picks it up on its own, but setting the
+# policy here also covers other entry points that import the app.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+import orjson
+from arq import create_pool
+from cachetools import TTLCache
+from arq.connections import ArqRedis, RedisSettings
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from fastapi.websockets import WebSocketState
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from redis.asyncio.client import PubSub
 
 from .database import db
+from .job_store import JOB_QUEUE_LIMIT, JOB_TTL_SECONDS, job_store
 from .models import (
     WebsiteRequest, WebsiteResponse, JobRequest, JobResponse, 
-    JobStatus, HealthResponse
+    JobStatus, HealthResponse, WebsiteVersionRecord
 )
-from .utils import (
-    extract_identifier, scrape_website, generate_optimized_html, 
-    ensure_unique_identifier, process_images, generate_version_instructions,
-    generate_three_versions_parallel
+
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
 )
+logger = logging.getLogger(__name__)
 
 # Create FastAPI application
 app = FastAPI(
@@ -44,29 +71,121 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global job storage for tracking async tasks
-active_jobs = {}
+# Compress HTML/JSON/JS responses on the fly. Generated versions are already
+# stored gzip-compressed and sent with Content-Encoding set, which the
+# middleware leaves alone, as it does event streams; level 6 keeps CPU cost
+# well below the default 9 for nearly the same ratio.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that lets browsers keep versioned URLs (?v=<hash>) forever.
+    
+    The pages' CSS and JS are gzipped once at startup, so versioned requests
+    for them are answered from memory instead of by GZipMiddleware each time.
+    """
+    
+    def __init__(self, *, directory: Path, precompress: Tuple[str, ...] = ()):
+        super().__init__(directory=directory)
+        self.precompressed = {
+            name: gzip.compress((directory / name).read_bytes(), compresslevel=9)
+            for name in precompress
+        }
+    
+    async def get_response(self, path: str, scope) -> Response:
+        gzipped = self.precompressed.get(path)
+        if (
+            gzipped is not None
+            and scope["method"] == "GET"
+            and b"v=" in scope.get("query_string", b"")
+            and "gzip" in Request(scope).headers.get("accept-encoding", "")
+        ):
+            return Response(
+                content=gzipped,
+                media_type=mimetypes.guess_type(path)[0],
+                headers={
+                    "Content-Encoding": "gzip",
+                    "Cache-Control": "public, max-age=31536000, immutable",
+                    "Vary": "Accept-Encoding"
+                }
+            )
+        return await super().get_response(path, scope)
+    
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        versioned = b"v=" in scope.get("query_string", b"")
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable" if versioned else "no-cache"
+        return response
+
+
+# Static files (web interface, status pages, viewer assets) live on disk so
+# they can be served by StaticFiles here, or by nginx/a CDN in front of the API
+frontend_path = Path(__file__).parent.parent / "frontend"
+app.mount(
+    "/static",
+    CachedStaticFiles(directory=frontend_path, precompress=("app.css", "app.js", "viewer.css", "viewer.js")),
+    name="static"
+)
+
+
+def _static_url(name: str) -> str:
+    """Get a /static URL for a file, versioned by a hash of its contents."""
+    digest = hashlib.sha256((frontend_path / name).read_bytes()).hexdigest()[:12]
+    return f"/static/{name}?v={digest}"
+
+_NOT_FOUND_PAGE = frontend_path / "404.html"
+_VERSION_NOT_FOUND_PAGE = frontend_path / "version-not-found.html"
+_PROCESSING_PAGE = frontend_path / "processing.html"
+
+# Job queue connection; generation jobs run in the arq worker (backend/worker.py)
+arq_pool: Optional[ArqRedis] = None
+
+# Completed and failed jobs never change again, so their status is kept in a
+# bounded per-process cache; entries age out with the Redis job state.
+finished_jobs: TTLCache = TTLCache(maxsize=10_000, ttl=JOB_TTL_SECONDS)
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database connection on startup."""
+    """
+    Initialize database, Redis and job queue connections on startup.
+    
+    All database reads and writes go through the asyncpg pool opened here,
+    sized by DB_POOL_MIN/DB_POOL_MAX, so requests reuse warm connections and
+    their cached prepared statements.
+    """
+    global arq_pool
     await db.connect()
-    print("🚀 Website Generator API started")
+    await job_store.connect()
+    arq_pool = await create_pool(RedisSettings.from_dsn(job_store.redis_url))
+    logger.info("Website Generator API started")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up database connection on shutdown."""
+    """Clean up database, Redis and job queue connections on shutdown."""
+    if arq_pool:
+        await arq_pool.aclose()
+    await job_store.disconnect()
     await db.disconnect()
-    print("👋 Website Generator API stopped")
+    logger.info("Website Generator API stopped")
+
+
+# (monotonic time, result) of the last database probe; a healthy result is
+# reused for HEALTH_CACHE_SECONDS so frequent liveness probes don't hit the pool
+_last_health: Tuple[float, bool] = (0.0, False)
+HEALTH_CACHE_SECONDS = 2.0
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
+    global _last_health
     try:
-        db_healthy = await db.health_check()
+        checked_at, db_healthy = _last_health
+        if not db_healthy or time.monotonic() - checked_at >= HEALTH_CACHE_SECONDS:
+            db_healthy = await db.health_check()
+            _last_health = (time.monotonic(), db_healthy)
         return HealthResponse(
             status="healthy" if db_healthy else "unhealthy",
             timestamp=datetime.now(),
@@ -80,134 +199,70 @@ async def health_check():
         )
 
 
-async def process_website_async(job_id: UUID, url: str):
-    """
-    Async background task to process website.
-    
-    Args:
-        job_id: The job ID to track progress
-        url: The URL to process
-    """
-    try:
-        print(f"🔄 Starting job {job_id} for URL: {url}")
-        
-        # Update job status to processing
-        await db.update_job_status(job_id, "processing")
-        active_jobs[str(job_id)] = {"status": "processing", "error": None}
-        
-        # Step 1: Extract identifier and check uniqueness
-        base_identifier = extract_identifier(url)
-        identifier = base_identifier
-        counter = 1
-        
-        while await db.website_exists(identifier):
-            identifier = f"{base_identifier}{counter}"
-            counter += 1
-            if counter > 100:  # Safety break
-                identifier = f"{base_identifier}_{str(uuid4())[:8]}"
-                break
-        
-        print(f"📋 Using identifier: {identifier}")
-        
-        # Step 2: Scrape the website
-        print(f"🌐 Scraping website: {url}")
-        scraped_data = scrape_website(url)
-        
-        # Step 3: Create website record
-        website_id = await db.create_website(
-            identifier=identifier,
-            original_url=url,
-            original_html=scraped_data['original_html']
-        )
-        
-        # Update job with website ID
-        await db.update_job_status(job_id, "processing", website_id=website_id)
-        active_jobs[str(job_id)]["website_id"] = str(website_id)
-        active_jobs[str(job_id)]["identifier"] = identifier
-        
-        print(f"💾 Created website record: {website_id}")
-        
-        # Step 4: Process images and convert to Cloudinary URLs
-        print(f"🖼️ Processing images...")
-        scraped_data = await process_images(scraped_data, website_id)
-        
-        # Step 5: Generate creative instructions using GPT-5 thinking mode
-        print(f"🎨 Generating 3 creative directions with GPT-5 thinking mode...")
-        instructions = generate_version_instructions(scraped_data)
-        
-        # Step 6: Generate 3 versions in parallel
-        print(f"🚀 Generating 3 website versions in parallel...")
-        version_htmls = await generate_three_versions_parallel(scraped_data, instructions)
-        
-        # Step 7: Store all successful versions in database
-        versions_created = 0
-        for version_num, version_key in enumerate([('version_1', 1), ('version_2', 2), ('version_3', 3)], start=1):
-            key, num = version_key
-            html = version_htmls.get(key)
-            instruction = instructions.get(key, '')
-            
-            if html:
-                try:
-                    await db.create_website_version(
-                        website_id=website_id,
-                        version_number=num,
-                        generation_instructions=instruction,
-                        generated_html=html
-                    )
-                    versions_created += 1
-                    print(f"✅ Stored version {num} ({len(html)} chars)")
-                except Exception as e:
-                    print(f"⚠️ Failed to store version {num}: {e}")
-        
-        # Step 8: Mark job as completed if at least 1 version succeeded
-        if versions_created > 0:
-            await db.update_job_status(job_id, "completed", website_id=website_id)
-            active_jobs[str(job_id)] = {
-                "status": "completed", 
-                "error": None,
-                "website_id": str(website_id),
-                "identifier": identifier,
-                "versions_generated": versions_created
-            }
-            print(f"✅ Job {job_id} completed successfully with {versions_created}/3 versions")
-        else:
-            raise Exception("All 3 versions failed to generate")
-        
-    except Exception as e:
-        error_msg = str(e)
-        print(f"❌ Job {job_id} failed: {error_msg}")
-        
-        # Update job status to failed
-        await db.update_job_status(job_id, "failed", error_message=error_msg)
-        active_jobs[str(job_id)] = {"status": "failed", "error": error_msg}
-
-
 @app.post("/generate", response_model=JobResponse)
-async def generate_website(
-    request: JobRequest, 
-    background_tasks: BackgroundTasks
-):
+async def generate_website(request: JobRequest):
     """
     Start website generation process.
     
     Args:
         request: Job request containing URL to process
-        background_tasks: FastAPI background tasks
         
     Returns:
         Job response with job ID for tracking
     """
     try:
+        # Already canonical (see JobRequest), so equivalent URLs share one job
+        url = str(request.url)
+        
+        # Reuse the job already processing this URL instead of starting another
+        existing_job_id = await job_store.get_inflight_job(url)
+        if existing_job_id:
+            existing_job = await _load_job_status(existing_job_id)
+            if existing_job and existing_job.status not in ("completed", "failed"):
+                logger.info("Joined in-flight job %s for URL: %s", existing_job_id, url)
+                return existing_job
+            # The job is gone or finished without releasing the URL; clear the stale claim
+            logger.warning("Released stale in-flight job %s for URL: %s", existing_job_id, url)
+            await job_store.release_url(url, existing_job_id)
+        
+        # arq keeps jobs in its queue until they finish, so this counts queued
+        # and running jobs; turn new work away rather than let the backlog grow
+        if await arq_pool.zcard(arq_pool.default_queue_name) >= JOB_QUEUE_LIMIT:
+            raise HTTPException(
+                status_code=503,
+                detail="Too many websites are being generated right now, please try again shortly",
+                headers={"Retry-After": "30"}
+            )
+        
         # Create a new job
         job_id = await db.create_job()
         
-        # Add to active jobs tracking
-        active_jobs[str(job_id)] = {"status": "pending", "error": None}
+        # Another request may have claimed the URL since the check above
+        existing_job_id = await job_store.claim_url(url, job_id)
+        if existing_job_id:
+            await db.update_job_status(job_id, "failed", error_message=f"Superseded by job {existing_job_id}")
+            # The winner may already be processing (or done), so report its real state
+            existing_job = await _load_job_status(existing_job_id)
+            if not existing_job:
+                raise HTTPException(
+                    status_code=503,
+                    detail="This URL is already being generated, please try again shortly",
+                    headers={"Retry-After": "1"}
+                )
+            logger.info("Joined in-flight job %s for URL: %s", existing_job_id, url)
+            return existing_job
         
-        # Start background processing
-        background_tasks.add_task(process_website_async, job_id, str(request.url))
+        try:
+            # Track the job in the shared job store
+            await job_store.set_job(job_id, status="pending", error=None)
+            
+            # Hand the job to the worker queue
+            await arq_pool.enqueue_job("process_website_async", str(job_id), url)
+        except Exception:
+            await job_store.release_url(url, job_id)
+            raise
         
-        print(f"🎯 Created job {job_id} for URL: {request.url}")
+        logger.info("Created job %s for URL: %s", job_id, url)
         
         return JobResponse(
             id=job_id,
@@ -215,103 +270,520 @@ async def generate_website(
             created_at=datetime.now()
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Failed to create job: {e}")
+        logger.exception("Failed to create job")
         raise HTTPException(status_code=500, detail=f"Failed to create job: {str(e)}")
 
 
-@app.get("/status/{job_id}", response_model=JobResponse)
-async def get_job_status(job_id: UUID):
+def _job_response_from_state(job_id: UUID, job_info: Dict[str, Optional[str]]) -> JobResponse:
     """
-    Get the status of a processing job.
+    Build a job response from job store state.
     
     Args:
-        job_id: The job ID to check
+        job_id: The job ID
+        job_info: Decoded job state from the job store
         
     Returns:
         Job status information
     """
-    try:
-        # Check active jobs first for real-time status
-        job_id_str = str(job_id)
-        if job_id_str in active_jobs:
-            job_info = active_jobs[job_id_str]
-            return JobResponse(
-                id=job_id,
-                website_id=UUID(job_info["website_id"]) if job_info.get("website_id") else None,
-                status=job_info["status"],
-                error_message=job_info.get("error"),
-                created_at=datetime.now(),
-                identifier=job_info.get("identifier")
-            )
-        
-        # Fallback to database
-        job = await db.get_job(job_id)
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
-        
-        # If job is completed, get identifier from website
-        identifier = None
-        if job.status == "completed" and job.website_id:
-            website = await db.get_website_by_id(job.website_id)
-            if website:
-                identifier = website.identifier
+    return JobResponse(
+        id=job_id,
+        website_id=UUID(job_info["website_id"]) if job_info.get("website_id") else None,
+        status=job_info["status"],
+        error_message=job_info.get("error"),
+        created_at=datetime.now(),
+        identifier=job_info.get("identifier")
+    )
+
+
+async def _load_job_status(job_id: UUID) -> Optional[JobResponse]:
+    """
+    Load a job's current status, preferring the shared job store over the database.
+    
+    Args:
+        job_id: The job ID to check
         
-        return JobResponse(
+    Returns:
+        Job status information, or None if the job does not exist
+    """
+    finished = finished_jobs.get(job_id)
+    if finished:
+        return finished
+    
+    # Check the shared job store first for real-time status
+    job_info = await job_store.get_job(job_id)
+    if job_info and job_info.get("status"):
+        response = _job_response_from_state(job_id, job_info)
+    else:
+        # Fallback to database; the website's identifier comes back in the same query
+        found = await db.get_job_with_identifier(job_id)
+        if not found:
+            return None
+        job, identifier = found
+        
+        response = JobResponse(
             id=job.id,
             website_id=job.website_id,
             status=job.status,
             error_message=job.error_message,
             created_at=job.created_at,
-            identifier=identifier
+            identifier=identifier if job.status == "completed" else None
         )
+    
+    if response.status in ("completed", "failed"):
+        finished_jobs[job_id] = response
+    return response
+
+
+# Plain status reads in progress; concurrent polls of the same job share one
+_status_reads: Dict[UUID, "asyncio.Task[Optional[JobResponse]]"] = {}
+
+
+def _status_read_done(job_id: UUID, task: "asyncio.Task[Optional[JobResponse]]") -> None:
+    """Forget a finished shared status read and retrieve its exception."""
+    if _status_reads.get(job_id) is task:
+        del _status_reads[job_id]
+    # Every waiter may have disconnected, leaving no one to retrieve it;
+    # asyncio would then log "Task exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+async def _load_job_status_shared(job_id: UUID) -> Optional[JobResponse]:
+    """
+    Load a job's status, sharing one read among concurrent requests for the job.
+    
+    Nothing is kept once the read finishes; only overlapping requests share
+    a result, so a poll is never answered with a stale cached state.
+    
+    Args:
+        job_id: The job ID to check
         
-    except HTTPException:
-        raise
+    Returns:
+        Job status information, or None if the job does not exist
+    """
+    task = _status_reads.get(job_id)
+    if task is None:
+        task = asyncio.create_task(_load_job_status(job_id))
+        _status_reads[job_id] = task
+        task.add_done_callback(partial(_status_read_done, job_id))
+    # A disconnecting client must not cancel the read for everyone else
+    return await asyncio.shield(task)
+
+
+# Longest a status request may be held open waiting for an update
+STATUS_MAX_WAIT_SECONDS = 25.0
+
+
+async def _wait_for_job_update(job_id: UUID, wait: float, seen_status: Optional[str]) -> Optional[JobResponse]:
+    """
+    Load a job's status, holding the request until its next update if the caller has already seen it.
+    
+    Args:
+        job_id: The job ID to check
+        wait: Seconds to wait for an update
+        seen_status: The status the caller last saw, if any
+        
+    Returns:
+        The updated (or, after the wait, current) job status, or None if the job does not exist
+    """
+    finished = finished_jobs.get(job_id)
+    if finished:
+        return finished
+    
+    # Subscribe before reading the current state so no transition is missed
+    pubsub = await job_store.subscribe(job_id)
+    try:
+        job = await _load_job_status(job_id)
+        if not job or job.status in ("completed", "failed") or (seen_status and job.status != seen_status):
+            return job
+        
+        # None also comes back for the subscribe confirmation, so the updates
+        # are followed until the deadline rather than until the first None
+        deadline = time.monotonic() + wait
+        async with aclosing(_follow_job(job_id, job, pubsub, idle_timeout=wait, deadline=deadline)) as updates:
+            async for update in updates:
+                if update is not None and update is not job:
+                    return update
+        return job
+    finally:
+        await pubsub.aclose()
+
+
+async def _poll_job_status(job_id: UUID, wait: float, status: Optional[str]) -> JobResponse:
+    """
+    Answer a status poll, long-polling when wait is given.
+    
+    Args:
+        job_id: The job ID to check
+        wait: Seconds to hold the request for the job's next update (0 answers at once)
+        status: The status the client last saw
+        
+    Returns:
+        Job status information
+        
+    Raises:
+        HTTPException: 404 for unknown jobs, 500 if the status cannot be read
+    """
+    try:
+        if wait > 0:
+            job = await _wait_for_job_update(job_id, min(wait, STATUS_MAX_WAIT_SECONDS), status)
+        else:
+            job = await _load_job_status_shared(job_id)
     except Exception as e:
-        print(f"❌ Failed to get job status: {e}")
+        logger.exception("Failed to get job status for %s", job_id)
         raise HTTPException(status_code=500, detail=f"Failed to get job status: {str(e)}")
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/status/{job_id}", response_model=JobResponse)
+async def get_job_status(job_id: UUID, wait: float = 0, status: Optional[str] = None):
+    """
+    Get the status of a processing job.
+    
+    With wait, a running job's status is only returned once it changes or
+    the wait runs out, so clients can long-poll instead of polling on a timer.
+    
+    Args:
+        job_id: The job ID to check
+        wait: Seconds (at most 25) to hold the request for the job's next update
+        status: The status the client last saw; a different one returns immediately
+        
+    Returns:
+        Job status information
+    """
+    job = await _poll_job_status(job_id, wait, status)
+    # Serialized straight from the model; returning it would make FastAPI
+    # validate it against response_model again on every poll
+    return Response(content=job.model_dump_json(), media_type="application/json")
+
+
+# One-character status codes for clients that only need to know when a job ends
+STATUS_CODES = {"pending": "p", "processing": "r", "completed": "c", "failed": "f"}
+
+
+@app.get("/status/{job_id}/code")
+async def get_job_status_code(job_id: UUID, wait: float = 0, status: Optional[str] = None):
+    """
+    Get a job's status as a single character (see STATUS_CODES).
+    
+    Takes the same wait/status long-poll parameters as /status/{job_id};
+    clients fetch the full status once the job completes or fails.
+    
+    Args:
+        job_id: The job ID to check
+        wait: Seconds (at most 25) to hold the request for the job's next update
+        status: The status the client last saw; a different one returns immediately
+        
+    Returns:
+        text/plain body of p (pending), r (processing), c (completed) or f (failed)
+    """
+    job = await _poll_job_status(job_id, wait, status)
+    return Response(content=STATUS_CODES.get(job.status, "?"), media_type="text/plain")
+
+
+async def _follow_job(
+    job_id: UUID,
+    job: JobResponse,
+    pubsub: PubSub,
+    idle_timeout: float,
+    deadline: Optional[float] = None
+) -> AsyncIterator[Optional[JobResponse]]:
+    """
+    Yield a job's status, then each update published on its channel.
+    
+    Stops after the job completes or fails, or at the deadline. None is
+    yielded whenever no update arrived within idle_timeout seconds, so
+    callers can keep idle connections alive.
+    
+    Args:
+        job_id: The job ID to follow
+        job: The job's current status, read after subscribing
+        pubsub: Subscription to the job's channel
+        idle_timeout: Seconds to wait for an update before yielding None
+        deadline: time.monotonic() value after which to stop waiting, if any
+    """
+    job_info = {
+        "status": job.status,
+        "error": job.error_message,
+        "website_id": str(job.website_id) if job.website_id else None,
+        "identifier": job.identifier
+    }
+    yield job
+    
+    while job_info["status"] not in ("completed", "failed"):
+        timeout = idle_timeout
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                return
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is None:
+            yield None
+            continue
+        job_info.update(job_store.decode(orjson.loads(message["data"])))
+        yield _job_response_from_state(job_id, job_info)
+
+
+@app.get("/events/{job_id}")
+async def stream_job_events(job_id: UUID):
+    """
+    Stream job status updates as Server-Sent Events.
+    
+    Sends the current status immediately, then one event per status change
+    published by the worker, and closes once the job completes or fails.
+    
+    Args:
+        job_id: The job ID to follow
+        
+    Returns:
+        text/event-stream response of JobResponse JSON payloads
+    """
+    # Subscribe before reading the current state so no transition is missed
+    pubsub = await job_store.subscribe(job_id)
+    try:
+        job = await _load_job_status(job_id)
+    except Exception:
+        await pubsub.aclose()
+        raise
+    if not job:
+        await pubsub.aclose()
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        try:
+            async for update in _follow_job(job_id, job, pubsub, idle_timeout=15.0):
+                if update is None:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                else:
+                    yield f"data: {update.model_dump_json()}\n\n"
+        finally:
+            await pubsub.aclose()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.websocket("/ws/status/{job_id}")
+async def job_status_websocket(websocket: WebSocket, job_id: UUID):
+    """
+    Push job status updates over a WebSocket.
+    
+    Sends the current status on connect, then one JSON message per status
+    change, and closes once the job completes or fails. Unknown jobs are
+    closed with code 4404, and server-side errors with 1011.
+    
+    Args:
+        websocket: The client connection
+        job_id: The job ID to follow
+    """
+    await websocket.accept()
+    pubsub = await job_store.subscribe(job_id)
+    
+    async def send_updates(job: JobResponse):
+        # Idle ticks are skipped; uvicorn's protocol-level pings keep the socket alive
+        async for update in _follow_job(job_id, job, pubsub, idle_timeout=15.0):
+            if update is not None:
+                await websocket.send_text(update.model_dump_json())
+    
+    async def wait_for_disconnect():
+        # Clients send nothing, but reading is how a disconnect gets noticed
+        # while the job is idle rather than on the next send
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+    
+    try:
+        job = await _load_job_status(job_id)
+        if not job:
+            await websocket.close(code=4404, reason="Job not found")
+            return
+        
+        sender = asyncio.create_task(send_updates(job))
+        receiver = asyncio.create_task(wait_for_disconnect())
+        try:
+            done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sender.cancel()
+            receiver.cancel()
+            await asyncio.wait({sender, receiver})
+        for task in done:
+            task.result()
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.debug("Status WebSocket for job %s disconnected", job_id)
+    except Exception:
+        logger.exception("Status WebSocket for job %s failed", job_id)
+        if websocket.client_state == WebSocketState.CONNECTED:
+            await websocket.close(code=1011, reason="Internal error")
+    finally:
+        await pubsub.aclose()
+
+
+# Lists up to this long are built in memory and sent with an ETag; longer ones
+# (e.g. admin dashboards) are streamed from a cursor row by row
+RECENT_WEBSITES_BUFFERED_LIMIT = 50
+RECENT_WEBSITES_MAX_LIMIT = 1000
+
+
+def _website_summary(website: Mapping[str, Any]) -> Dict[str, Any]:
+    """Build a /websites list entry from a get_recent_websites_with_versions() row."""
+    available_versions = website['available_versions']
+    return {
+        "id": website['id'],
+        "identifier": website['identifier'],
+        "original_url": website['original_url'],
+        "created_at": website['created_at'],
+        "has_generated_html": len(available_versions) > 0,
+        "available_versions": available_versions,
+        "default_version": 1 if 1 in available_versions else (available_versions[0] if available_versions else None)
+    }
+
+
+async def _stream_recent_websites(limit: int) -> AsyncIterator[bytes]:
+    """Yield the /websites JSON array one website at a time."""
+    separator = b"["
+    async for website in db.iter_recent_websites_with_versions(limit):
+        yield separator + orjson.dumps(_website_summary(website))
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
 
 
 @app.get("/websites")
-async def get_recent_websites():
+async def get_recent_websites(request: Request, limit: int = 10):
     """
-    Get the 10 most recent generated websites with version information.
+    Get the most recent generated websites with version information.
+    
+    The web UI shows its last copy of the list first and revalidates it here,
+    so unchanged lists come back as a bodyless 304.
+    
+    Args:
+        limit: Number of websites to list (10 by default, at most 1000); lists
+            longer than 50 are streamed and carry no ETag
     
     Returns:
         List of recent websites with basic information and available versions
     """
+    limit = max(1, min(limit, RECENT_WEBSITES_MAX_LIMIT))
+    if limit > RECENT_WEBSITES_BUFFERED_LIMIT:
+        return StreamingResponse(
+            _stream_recent_websites(limit),
+            media_type="application/json",
+            headers={"Cache-Control": "no-cache"}
+        )
     try:
-        websites = await db.get_recent_websites(10)
-        result = []
-        
-        for website in websites:
-            # Get available versions for this website
-            available_versions = await db.get_available_versions(website.id)
-            
-            result.append({
-                "id": str(website.id),
-                "identifier": website.identifier,
-                "original_url": website.original_url,
-                "created_at": website.created_at.isoformat(),
-                "has_generated_html": len(available_versions) > 0,
-                "available_versions": available_versions,
-                "default_version": 1 if 1 in available_versions else (available_versions[0] if available_versions else None)
-            })
-        
-        return result
+        # Versions come back with each website, so this is a single query
+        websites = await db.get_recent_websites_with_versions(limit)
+        content = orjson.dumps([_website_summary(website) for website in websites])
+        headers = {
+            "ETag": f'"{hashlib.sha256(content).hexdigest()[:16]}"',
+            "Cache-Control": "no-cache"
+        }
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=content, media_type="application/json", headers=headers)
     except Exception as e:
-        print(f"❌ Failed to get recent websites: {e}")
+        logger.exception("Failed to get recent websites")
         raise HTTPException(status_code=500, detail=f"Failed to get recent websites: {str(e)}")
 
 
+def _compile_template(template: str) -> List[Union[bytes, str]]:
+    """
+    Split a template on its __NAME__ markers.
+    
+    Args:
+        template: Template text containing __NAME__ markers
+        
+    Returns:
+        Alternating encoded static chunks and marker names
+    """
+    parts = re.split(r"__([A-Z_]+)__", template)
+    return [part if index % 2 else part.encode("utf-8") for index, part in enumerate(parts)]
+
+
+def _render_template(chunks: List[Union[bytes, str]], values: Dict[str, str]) -> bytes:
+    """
+    Fill a compiled template's markers.
+    
+    Args:
+        chunks: Output of _compile_template()
+        values: Already-escaped text for each marker name
+        
+    Returns:
+        The encoded page
+    """
+    return b"".join(
+        part if isinstance(part, bytes) else values[part].encode("utf-8")
+        for part in chunks
+    )
+
+
+# HTML pages with dynamic parts live in backend/templates; the __NAME__
+# markers are the only dynamic parts, so each template is read and split on
+# them once at import and each render only joins bytes.
+templates_path = Path(__file__).parent / "templates"
+_VIEWER_CHUNKS = _compile_template((templates_path / "viewer.html").read_text(encoding="utf-8"))
+_SERVER_ERROR_CHUNKS = _compile_template((templates_path / "server-error.html").read_text(encoding="utf-8"))
+
+
+def _server_error_response(error: Exception) -> Response:
+    """Build the 500 page shown when a website or version cannot be loaded."""
+    return Response(
+        content=_render_template(_SERVER_ERROR_CHUNKS, {"ERROR": html.escape(str(error)[:200])}),
+        status_code=500,
+        media_type="text/html"
+    )
+
+
+def _raw_html_response(request: Request, version: WebsiteVersionRecord, cache_control: str) -> Response:
+    """
+    Build the response for a generated version's HTML.
+    
+    Args:
+        request: The incoming request
+        version: The version record to serve
+        cache_control: Cache-Control header value
+        
+    Returns:
+        304 if the client's ETag matches, else the HTML (gzip-encoded when accepted)
+    """
+    if not version.html_sha256:
+        # Rows written before hashes were stored: no ETag, but still let the
+        # viewer's iframe reuse the copy the preview already fetched
+        return HTMLResponse(content=version.generated_html, headers={"Cache-Control": "private, max-age=600"})
+    
+    headers = {
+        "ETag": f'"{version.html_sha256}"',
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding"
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    
+    if version.html_gzip and "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=version.html_gzip, media_type="text/html", headers=headers)
+    
+    return HTMLResponse(content=version.generated_html, headers=headers)
+
+
 @app.get("/raw/{identifier}/{version_number}", response_class=HTMLResponse)
 @app.get("/raw/{identifier}", response_class=HTMLResponse)
-async def get_raw_website(identifier: str, version_number: int = 1):
+async def get_raw_website(request: Request, identifier: str, version_number: int = 1):
     """
     Serve the raw generated website HTML for iframe embedding.
     
     Args:
+        request: The incoming request (for conditional and encoding headers)
         identifier: The website identifier
         version_number: The version number (1, 2, or 3), defaults to 1
         
@@ -319,112 +791,79 @@ async def get_raw_website(identifier: str, version_number: int = 1):
         Raw HTML response without security headers
     """
     try:
-        # Get the specific version
-        version = await db.get_website_version(identifier, version_number)
+        # Get the specific version, or version 1 as fallback, in one query
+        website_exists, version = await db.get_version_with_fallback(identifier, version_number)
         
-        if not version:
-            # Try to get the website to see if it exists
-            website = await db.get_website(identifier)
-            if not website:
-                return HTMLResponse(
-                    content="""
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <title>Website Not Found</title>
-                        <style>
-                            body { font-family: Arial, sans-serif; text-align: center; padding: 50px; }
-                            .error { color: #e74c3c; }
-                        </style>
-                    </head>
-                    <body>
-                        <h1 class="error">Website Not Found</h1>
-                        <p>The requested website could not be found.</p>
-                        <p>Please check the URL and try again.</p>
-                    </body>
-                    </html>
-                    """,
-                    status_code=404
-                )
-            else:
-                # Website exists but version doesn't - try version 1 as fallback
-                if version_number != 1:
-                    version = await db.get_website_version(identifier, 1)
-                    if version and version.generated_html:
-                        return HTMLResponse(content=version.generated_html)
-                
-                return HTMLResponse(
-                    content=f"""
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <title>Version Not Found</title>
-                        <style>
-                            body {{ font-family: Arial, sans-serif; text-align: center; padding: 50px; }}
-                            .error {{ color: #e74c3c; }}
-                        </style>
-                    </head>
-                    <body>
-                        <h1 class="error">Version {version_number} Not Found</h1>
-                        <p>This version is still being processed or failed to generate.</p>
-                        <p>Please try another version or try again later.</p>
-                    </body>
-                    </html>
-                    """,
-                    status_code=404
-                )
+        if not website_exists:
+            return FileResponse(_NOT_FOUND_PAGE, status_code=404, media_type="text/html")
+        
+        if not version or version.version_number != version_number:
+            # Website exists but version doesn't - serve version 1 if it has HTML
+            if version and version.generated_html:
+                # The requested version may still appear, so don't let this be cached as immutable
+                return _raw_html_response(request, version, "no-cache")
+            
+            return FileResponse(_VERSION_NOT_FOUND_PAGE, status_code=404, media_type="text/html")
         
         if not version.generated_html:
-            return HTMLResponse(
-                content=f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>Website Processing</title>
-                    <style>
-                        body {{ font-family: Arial, sans-serif; text-align: center; padding: 50px; }}
-                        .processing {{ color: #3498db; }}
-                    </style>
-                </head>
-                <body>
-                    <h1 class="processing">Version {version_number} Processing</h1>
-                    <p>This version is still being generated.</p>
-                    <p>Please try again in a few moments.</p>
-                </body>
-                </html>
-                """,
-                status_code=202
-            )
+            return FileResponse(_PROCESSING_PAGE, status_code=202, media_type="text/html")
         
         # Serve raw HTML without restrictive security headers for iframe embedding
-        return HTMLResponse(content=version.generated_html)
+        return _raw_html_response(request, version, "public, max-age=3600, immutable")
         
     except Exception as e:
-        print(f"❌ Failed to serve raw website {identifier} version {version_number}: {e}")
-        return HTMLResponse(
-            content=f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Server Error</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; text-align: center; padding: 50px; }}
-                    .error {{ color: #e74c3c; }}
-                </style>
-            </head>
-            <body>
-                <h1 class="error">Server Error</h1>
-                <p>An error occurred while loading this website.</p>
-                <p>Error: {str(e)[:200]}</p>
-            </body>
-            </html>
-            """,
-            status_code=500
-        )
+        logger.exception("Failed to serve raw website %s version %s", identifier, version_number)
+        return _server_error_response(e)
+
+
+# The viewer's CSS and JS are static assets; their URLs change with their contents
+_VIEWER_CSS_URL = _static_url("viewer.css")
+_VIEWER_JS_URL = _static_url("viewer.js")
+
+_VIEWER_HEADERS = {
+    "X-Frame-Options": "DENY",
+    "Content-Security-Policy": "default-src 'self'; style-src 'self'; script-src 'self'; frame-src 'self';",
+    "X-Content-Type-Options": "nosniff"
+}
+
+
+@lru_cache(maxsize=1024)
+def _render_viewer(identifier: str, original_url: str, default_version: int, available_versions: Tuple[int, ...]) -> Tuple[bytes, str]:
+    """
+    Render the viewer page from its precompiled chunks.
+    
+    Cached on all inputs, so repeat views of a site return the same bytes
+    object and ETag; the available versions are part of the key, so a new
+    version never serves a stale page.
+    
+    Args:
+        identifier: The website identifier
+        original_url: The scraped site's URL
+        default_version: Version loaded into the iframe first
+        available_versions: Versions that have generated HTML
+        
+    Returns:
+        The encoded viewer page and its ETag
+    """
+    buttons = "".join(
+        f'<button class="version-btn{" active" if version == default_version else ""}" data-version="{version}"'
+        f'{"" if version in available_versions else " disabled"}>Version {version}</button>'
+        for version in (1, 2, 3)
+    )
+    values = {
+        "IDENTIFIER": html.escape(identifier),
+        "ORIGINAL_URL": html.escape(original_url),
+        "DEFAULT_VERSION": str(default_version),
+        "VERSION_BUTTONS": buttons,
+        "VIEWER_CSS": _VIEWER_CSS_URL,
+        "VIEWER_JS": _VIEWER_JS_URL
+    }
+    page = _render_template(_VIEWER_CHUNKS, values)
+    return page, f'"{hashlib.sha256(page).hexdigest()[:16]}"'
 
 
 @app.get("/website/{identifier}", response_class=HTMLResponse)
-async def get_website(identifier: str):
+async def get_website(request: Request, identifier: str):
     """
     Serve the website viewer page with sandboxed iframe.
     
@@ -435,1340 +874,183 @@ async def get_website(identifier: str):
         HTML response with iframe viewer
     """
     try:
-        # Check if website exists
-        website = await db.get_website(identifier)
-        if not website:
-            return HTMLResponse(
-                content="""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>Website Not Found</title>
-                    <style>
-                        body { font-family: Arial, sans-serif; text-align: center; padding: 50px; }
-                        .error { color: #e74c3c; }
-                    </style>
-                </head>
-                <body>
-                    <h1 class="error">Website Not Found</h1>
-                    <p>The requested website could not be found.</p>
-                    <p>Please check the URL and try again.</p>
-                </body>
-                </html>
-                """,
-                status_code=404
-            )
-        
-        # Get available versions
-        available_versions = await db.get_available_versions(website.id)
+        # Load the website and its available versions in one query
+        result = await db.get_website_with_versions(identifier)
+        if not result:
+            return FileResponse(_NOT_FOUND_PAGE, status_code=404, media_type="text/html")
+        website, available_versions = result
         default_version = 1 if 1 in available_versions else (available_versions[0] if available_versions else 1)
         
-        # Serve iframe viewer page
-        return HTMLResponse(
-            content=f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Website Viewer - {identifier}</title>
-                <style>
-                    * {{
-                        margin: 0;
-                        padding: 0;
-                        box-sizing: border-box;
-                    }}
-                    
-                    body {{
-                        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                        background: #f5f5f5;
-                        display: flex;
-                        flex-direction: column;
-                        height: 100vh;
-                    }}
-                    
-                    .header {{
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        padding: 15px 20px;
-                        display: flex;
-                        justify-content: space-between;
-                        align-items: center;
-                        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    }}
-                    
-                    .header h1 {{
-                        font-size: 1.2rem;
-                        font-weight: 600;
-                    }}
-                    
-                    .header .url {{
-                        font-size: 0.9rem;
-                        opacity: 0.9;
-                        background: rgba(255,255,255,0.2);
-                        padding: 5px 12px;
-                        border-radius: 20px;
-                        max-width: 300px;
-                        overflow: hidden;
-                        text-overflow: ellipsis;
-                        white-space: nowrap;
-                    }}
-                    
-                    .version-control-wrapper {{
-                        background: #f8f9fa;
-                        padding: 15px 20px;
-                        border-bottom: 1px solid #dee2e6;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                    }}
-                    
-                    .version-control {{
-                        display: flex;
-                        gap: 0;
-                        background: white;
-                        border-radius: 8px;
-                        padding: 4px;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    }}
-                    
-                    .version-btn {{
-                        padding: 10px 24px;
-                        border: none;
-                        background: transparent;
-                        color: #495057;
-                        font-size: 0.95rem;
-                        font-weight: 500;
-                        cursor: pointer;
-                        transition: all 0.2s ease;
-                        border-radius: 6px;
-                    }}
-                    
-                    .version-btn:hover:not(:disabled) {{
-                        background: #f8f9fa;
-                        color: #667eea;
-                    }}
-                    
-                    .version-btn.active {{
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        color: white;
-                        box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3);
-                    }}
-                    
-                    .version-btn:disabled {{
-                        opacity: 0.4;
-                        cursor: not-allowed;
-                    }}
-                    
-                    .iframe-container {{
-                        flex: 1;
-                        padding: 0;
-                        background: white;
-                    }}
-                    
-                    .website-frame {{
-                        width: 100%;
-                        height: 100%;
-                        border: none;
-                        display: block;
-                    }}
-                    
-                    .security-notice {{
-                        position: fixed;
-                        bottom: 10px;
-                        right: 10px;
-                        background: rgba(0,0,0,0.8);
-                        color: white;
-                        padding: 8px 12px;
-                        border-radius: 6px;
-                        font-size: 0.8rem;
-                        opacity: 0.7;
-                        z-index: 1000;
-                    }}
-                    
-                    @media (max-width: 768px) {{
-                        .header {{
-                            flex-direction: column;
-                            gap: 10px;
-                            text-align: center;
-                        }}
-                        
-                        .header .url {{
-                            max-width: 100%;
-                        }}
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>🌐 Generated Website</h1>
-                    <div class="url">{website.original_url}</div>
-                </div>
-                
-                <div class="version-control-wrapper">
-                    <div class="version-control">
-                        <button class="version-btn{'  active' if default_version == 1 else ''}" data-version="1" {'disabled' if 1 not in available_versions else ''}>
-                            Version 1
-                        </button>
-                        <button class="version-btn{' active' if default_version == 2 else ''}" data-version="2" {'disabled' if 2 not in available_versions else ''}>
-                            Version 2
-                        </button>
-                        <button class="version-btn{' active' if default_version == 3 else ''}" data-version="3" {'disabled' if 3 not in available_versions else ''}>
-                            Version 3
-                        </button>
-                    </div>
-                </div>
-                
-                <div class="iframe-container">
-                    <iframe 
-                        id="website-frame"
-                        src="/raw/{identifier}/{default_version}"
-                        class="website-frame"
-                        sandbox="allow-scripts allow-same-origin allow-forms allow-popups allow-top-navigation-by-user-activation"
-                        loading="lazy"
-                        title="Generated website for {identifier}">
-                    </iframe>
-                </div>
-                
-                <div class="security-notice">
-                    🔒 Sandboxed Content
-                </div>
-                
-                <script>
-                    // Handle version switching
-                    const versionButtons = document.querySelectorAll('.version-btn');
-                    const iframe = document.getElementById('website-frame');
-                    const identifier = '{identifier}';
-                    
-                    // Load version from URL hash on page load
-                    function loadVersionFromHash() {{
-                        const hash = window.location.hash.substring(1); // Remove #
-                        if (hash.startsWith('v')) {{
-                            const versionNum = parseInt(hash.substring(1));
-                            if (versionNum >= 1 && versionNum <= 3) {{
-                                switchToVersion(versionNum);
-                            }}
-                        }}
-                    }}
-                    
-                    function switchToVersion(versionNum) {{
-                        // Update iframe src
-                        iframe.src = `/raw/${{identifier}}/${{versionNum}}`;
-                        
-                        // Update button states
-                        versionButtons.forEach(btn => {{
-                            const btnVersion = parseInt(btn.dataset.version);
-                            if (btnVersion === versionNum) {{
-                                btn.classList.add('active');
-                            }} else {{
-                                btn.classList.remove('active');
-                            }}
-                        }});
-                        
-                        // Update URL hash without reloading
-                        window.location.hash = `v${{versionNum}}`;
-                    }}
-                    
-                    // Add click handlers to version buttons
-                    versionButtons.forEach(button => {{
-                        button.addEventListener('click', () => {{
-                            if (button.disabled) return;
-                            const version = parseInt(button.dataset.version);
-                            switchToVersion(version);
-                        }});
-                    }});
-                    
-                    // Load version from hash on initial load
-                    window.addEventListener('DOMContentLoaded', loadVersionFromHash);
-                    
-                    // Handle hash changes (browser back/forward)
-                    window.addEventListener('hashchange', loadVersionFromHash);
-                </script>
-            </body>
-            </html>
-            """,
-            headers={
-                "X-Frame-Options": "DENY",
-                "Content-Security-Policy": "default-src 'self'; style-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'; frame-src 'self';",
-                "X-Content-Type-Options": "nosniff"
-            }
-        )
+        # Serve iframe viewer page; revalidated against the ETag on every view
+        page, etag = _render_viewer(identifier, website.original_url, default_version, tuple(available_versions))
+        headers = {**_VIEWER_HEADERS, "ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=page, media_type="text/html", headers=headers)
         
     except Exception as e:
-        print(f"❌ Failed to serve website viewer {identifier}: {e}")
-        return HTMLResponse(
-            content=f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Server Error</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; text-align: center; padding: 50px; }}
-                    .error {{ color: #e74c3c; }}
-                </style>
-            </head>
-            <body>
-                <h1 class="error">Server Error</h1>
-                <p>An error occurred while loading this website.</p>
-                <p>Error: {str(e)[:200]}</p>
-            </body>
-            </html>
-            """,
-            status_code=500
-        )
+        logger.exception("Failed to serve website viewer %s", identifier)
+        return _server_error_response(e)
 
 
-# Demo website path
+@app.get("/website/{identifier}/images")
+async def get_website_image_map(identifier: str):
+    """
+    Get the Cloudinary URLs a generated website uses in place of its original images.
+    
+    Args:
+        identifier: The website identifier
+        
+    Returns:
+        JSON object with the website's identifier, original_url and images
+        (a map from each original image URL to its Cloudinary URL)
+    """
+    try:
+        result = await db.get_website_with_images(identifier)
+    except Exception as e:
+        logger.exception("Failed to get images for website %s", identifier)
+        raise HTTPException(status_code=500, detail=f"Failed to get website images: {str(e)}")
+    if not result:
+        raise HTTPException(status_code=404, detail="Website not found")
+    website, image_mappings = result
+    content = orjson.dumps({
+        "identifier": website.identifier,
+        "original_url": website.original_url,
+        "images": image_mappings
+    })
+    return Response(content=content, media_type="application/json")
+
+
+# Demo website path, resolved once so request paths can be checked without touching the filesystem
 demo_website_path = Path(__file__).parent.parent / "demo-website" / "roberts-hvac"
+_DEMO_ROOT = str(demo_website_path.resolve())
+_DEMO_ROOT_PREFIX = _DEMO_ROOT + os.sep
+
+# Content types the demo needs spelled out; anything else is guessed from the extension
+_DEMO_CONTENT_TYPES = {
+    ".js": "text/javascript",
+    ".css": "text/css",
+    ".json": "application/json",
+    ".svg": "image/svg+xml"
+}
 
 @app.get("/demo/{file_path:path}")
 async def serve_demo_file(file_path: str):
     """Serve files from the demo website."""
     try:
-        full_path = demo_website_path / file_path
-        # Security: ensure file is within demo directory
-        if not str(full_path.resolve()).startswith(str(demo_website_path.resolve())):
+        # Security: ensure file is within demo directory (normpath collapses "..")
+        full_path = os.path.normpath(os.path.join(_DEMO_ROOT, file_path))
+        if not full_path.startswith(_DEMO_ROOT_PREFIX):
             raise HTTPException(status_code=403, detail="Access denied")
         
-        if not full_path.exists():
+        if not os.path.isfile(full_path):
             raise HTTPException(status_code=404, detail="File not found")
         
-        # Determine content type
-        content_type = "text/html"
-        if file_path.endswith(".js"):
-            content_type = "text/javascript"
-        elif file_path.endswith(".css"):
-            content_type = "text/css"
-        elif file_path.endswith(".json"):
-            content_type = "application/json"
-        elif file_path.endswith(".svg"):
-            content_type = "image/svg+xml"
-        
-        with open(full_path, "rb") as f:
-            content = f.read()
-        
-        return HTMLResponse(content=content, media_type=content_type)
+        # Streamed from disk by the server instead of read on the event loop
+        return FileResponse(full_path, media_type=_DEMO_CONTENT_TYPES.get(os.path.splitext(full_path)[1]))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/demo")
-async def serve_demo_index():
-    """Serve the demo website index page."""
+
+@lru_cache(maxsize=1)
+def _demo_index_page() -> Optional[bytes]:
+    """Read the demo index once, with a base tag so its relative paths resolve under /demo/."""
     index_path = demo_website_path / "index.html"
     if not index_path.exists():
-        raise HTTPException(status_code=404, detail="Demo website not found")
-    
-    with open(index_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
-        # Add base tag to make relative paths work correctly
-        html_content = html_content.replace('<head>', '<head><base href="/demo/">')
-        return HTMLResponse(content=html_content, media_type="text/html")
+        return None
+    html_content = index_path.read_text(encoding="utf-8")
+    return html_content.replace('<head>', '<head><base href="/demo/">').encode("utf-8")
 
-# Serve the main web interface
-@app.get("/", response_class=HTMLResponse)
-async def serve_index():
-    """Serve the main web interface."""
-    return HTMLResponse(content="""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Website Generator</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: flex-start;
-            padding: 40px 20px;
-        }
-        
-        .container {
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 30px 60px rgba(0,0,0,0.2);
-            padding: 40px;
-            max-width: 900px;
-            width: 100%;
-            text-align: center;
-        }
-        
-        h1 {
-            color: #333;
-            margin-bottom: 10px;
-            font-size: 2.5rem;
-            font-weight: 700;
-        }
-        
-        .subtitle {
-            color: #666;
-            margin-bottom: 40px;
-            font-size: 1.2rem;
-        }
-        
-        .form-group {
-            margin-bottom: 20px;
-            text-align: left;
-        }
-        
-        label {
-            display: block;
-            margin-bottom: 8px;
-            color: #333;
-            font-weight: 600;
-        }
-        
-        input[type="url"] {
-            width: 100%;
-            padding: 15px;
-            border: 2px solid #e1e5e9;
-            border-radius: 10px;
-            font-size: 1rem;
-            transition: border-color 0.3s ease;
-        }
-        
-        input[type="url"]:focus {
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }
-        
-        .btn {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            padding: 15px 30px;
-            border-radius: 10px;
-            font-size: 1.1rem;
-            font-weight: 600;
-            cursor: pointer;
-            width: 100%;
-            transition: transform 0.2s ease, box-shadow 0.2s ease;
-        }
-        
-        .btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(102, 126, 234, 0.3);
-        }
-        
-        .btn:disabled {
-            opacity: 0.6;
-            cursor: not-allowed;
-            transform: none;
-            box-shadow: none;
-        }
-        
-        .status {
-            margin-top: 20px;
-            display: none;
-            text-align: center;
-            color: #333;
-            font-size: 1rem;
-        }
-        
-        .status.show {
-            display: block;
-        }
-        
-        .spinner {
-            display: inline-block;
-            width: 16px;
-            height: 16px;
-            border: 2px solid #f3f3f3;
-            border-top: 2px solid #667eea;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin-right: 8px;
-            vertical-align: middle;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        
-        .btn.loading {
-            background: transparent !important;
-            color: #333 !important;
-            box-shadow: none !important;
-            border: 2px solid #e1e5e9 !important;
-        }
-        
-        .btn.loading:hover {
-            transform: none !important;
-            box-shadow: none !important;
-        }
-        
-        .result {
-            margin-top: 20px;
-            display: none;
-        }
-        
-        .result.show {
-            display: block;
-        }
-        
-        .result-btn {
-            background: #4caf50;
-            color: white;
-            border: none;
-            padding: 12px 25px;
-            border-radius: 8px;
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            text-decoration: none;
-            display: inline-block;
-            transition: background 0.3s ease;
-        }
-        
-        .result-btn:hover {
-            background: #45a049;
-        }
-        
-        
-        .preview-section {
-            margin-top: 25px;
-        }
-        
-        .preview-title {
-            color: #333;
-            margin-bottom: 15px;
-            font-size: 1.1rem;
-            font-weight: 600;
-            text-align: center;
-        }
-        
-        .preview-container {
-            width: 100%;
-            aspect-ratio: 1;
-            border: 2px solid #e1e5e9;
-            border-radius: 15px;
-            overflow: hidden;
-            position: relative;
-            background: #f8f9fa;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        }
-        
-        .preview-iframe {
-            position: absolute;
-            top: 0;
-            left: 0;
-            border: none;
-            transform-origin: top left;
-            background: white;
-        }
-        
-        @media (min-width: 769px) {
-            .preview-iframe {
-                width: 1200px;
-                height: 800px;
-                transform: scale(0.5);
-            }
-        }
-        
-        @media (min-width: 481px) and (max-width: 768px) {
-            .preview-iframe {
-                width: 768px;
-                height: 1024px;
-                transform: scale(0.6);
-            }
-        }
-        
-        @media (max-width: 480px) {
-            body {
-                padding: 20px 10px;
-            }
-            
-            .container {
-                padding: 30px 20px;
-            }
-            
-            h1 {
-                font-size: 2rem;
-            }
-            
-            .preview-iframe {
-                width: 375px;
-                height: 667px;
-                transform: scale(1.2);
-            }
-        }
-        
-        /* Website List Styles */
-        .websites-container {
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 30px 60px rgba(0,0,0,0.2);
-            padding: 40px;
-            max-width: 900px;
-            width: 100%;
-            margin: 30px 0 0 0;
-            display: none;
-        }
-        
-        .websites-container.show {
-            display: block;
-        }
-        
-        .websites-container h2 {
-            color: #333;
-            margin-bottom: 30px;
-            font-size: 2rem;
-            font-weight: 700;
-            text-align: center;
-        }
-        
-        .websites-list {
-            display: flex;
-            flex-direction: column;
-            gap: 15px;
-        }
-        
-        .website-item {
-            border: 2px solid #e1e5e9;
-            border-radius: 12px;
-            overflow: hidden;
-            transition: all 0.3s ease;
-        }
-        
-        .website-item:hover {
-            border-color: #667eea;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.1);
-        }
-        
-        .website-header {
-            padding: 15px 20px;
-            background: #f8f9fa;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: background-color 0.3s ease;
-            gap: 20px;
-        }
-        
-        /* Collapsed header is fully clickable */
-        .website-item:not(.expanded) .website-header {
-            cursor: pointer;
-        }
-        
-        /* Expanded header is not clickable (buttons handle their own clicks) */
-        .website-item.expanded .website-header {
-            cursor: default;
-        }
-        
-        .website-header-left {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            flex: 0 0 auto;
-        }
-        
-        .website-header-center {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            flex: 1;
-        }
-        
-        .website-header-right {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            flex: 0 0 auto;
-        }
-        
-        .expand-arrow {
-            font-size: 1.2rem;
-            color: #667eea;
-            transition: transform 0.3s ease;
-            user-select: none;
-            cursor: pointer;
-        }
-        
-        /* Hide View Website button by default - use !important to ensure it works */
-        .website-btn-expanded-only {
-            display: none !important;
-        }
-        
-        /* Show View Website button only when expanded */
-        .website-item.expanded .website-btn-expanded-only {
-            display: inline-block !important;
-        }
-        
-        .website-header:hover {
-            background: #e9ecef;
-        }
-        
-        .website-name {
-            font-weight: 600;
-            color: #333;
-            font-size: 1rem;
-        }
-        
-        
-        .website-item.expanded .expand-arrow {
-            transform: rotate(180deg);
-        }
-        
-        .website-content {
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.3s ease;
-            padding: 0 20px;
-        }
-        
-        .website-item.expanded .website-content {
-            max-height: 650px;
-            padding: 20px;
-        }
-        
-        .view-website-btn {
-            border: none;
-            padding: 8px 15px;
-            border-radius: 6px;
-            font-size: 0.9rem;
-            font-weight: 600;
-            cursor: pointer;
-            text-decoration: none;
-            display: inline-block;
-            transition: all 0.3s ease;
-            position: relative;
-            z-index: 10;
-        }
-        
-        .view-website-btn:active {
-            transform: scale(0.95);
-        }
-        
-        .view-website-btn.primary {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-        }
-        
-        .view-website-btn.primary:hover {
-            background: linear-gradient(135deg, #5a6fd8 0%, #6a4190 100%);
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(102, 126, 234, 0.3);
-        }
-        
-        .view-website-btn.secondary {
-            background: transparent;
-            color: #666;
-            border: 1px solid #ddd;
-            font-weight: 500;
-        }
-        
-        .view-website-btn.secondary:hover {
-            background: #f5f5f5;
-            color: #333;
-            border-color: #bbb;
-        }
-        
-        .website-preview {
-            width: 100%;
-            height: 450px;
-            border: 2px solid #e1e5e9;
-            border-radius: 10px;
-            overflow: hidden;
-            background: #f8f9fa;
-            position: relative;
-            transition: all 0.3s ease;
-        }
-        
-        .website-preview:hover {
-            border-color: #667eea;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.15);
-            transform: translateY(-2px);
-        }
-        
-        .website-preview iframe {
-            width: 1200px;
-            height: 800px;
-            border: none;
-            background: white;
-            transform-origin: top left;
-            position: absolute;
-            top: 0;
-            left: 0;
-            transition: none; /* No fade when switching versions */
-        }
-        
-        /* Calculate scale based on container width */
-        @media (min-width: 901px) {
-            .website-preview iframe {
-                transform: scale(calc((900px - 80px) / 1200px)); /* 900px container - 40px padding each side */
-            }
-        }
-        
-        @media (max-width: 900px) {
-            .website-preview iframe {
-                transform: scale(calc((100vw - 120px) / 1200px)); /* viewport width - padding and margins */
-            }
-        }
-        
-        .empty-state {
-            text-align: center;
-            padding: 40px 20px;
-            color: #666;
-            font-size: 1.1rem;
-        }
-        
-        .empty-state.hidden {
-            display: none;
-        }
-        
-        /* Version control styles for list view */
-        .version-control-list {
-            display: flex;
-            justify-content: center;
-            gap: 0;
-        }
-        
-        /* Version control in header (no extra padding/border) */
-        .website-header-center .version-control-list {
-            margin: 0;
-            padding: 0;
-            border: none;
-        }
-        
-        .version-control-list .version-control {
-            display: flex;
-            gap: 0;
-            background: white;
-            border-radius: 6px;
-            padding: 3px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            border: 1px solid #e1e5e9;
-        }
-        
-        .version-control-list .version-btn {
-            padding: 8px 15px;
-            border: none;
-            background: transparent;
-            color: #495057;
-            font-size: 0.9rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            border-radius: 6px;
-        }
-        
-        .version-control-list .version-btn:hover:not(:disabled) {
-            background: #f8f9fa;
-            color: #667eea;
-        }
-        
-        .version-control-list .version-btn.active {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3);
-        }
-        
-        .version-control-list .version-btn:disabled {
-            opacity: 0.4;
-            cursor: not-allowed;
-        }
-        
-        /* Mobile responsive scaling for previews */
-        @media (max-width: 768px) {
-            .website-preview {
-                height: 375px;
-            }
-            
-            .website-preview iframe {
-                width: 768px;
-                height: 1024px;
-                transform: scale(calc((100vw - 80px) / 768px));
-            }
-        }
-        
-        @media (max-width: 768px) {
-            .website-header {
-                flex-wrap: wrap;
-            }
-            
-            .website-header-center {
-                order: 3;
-                flex-basis: 100%;
-                margin-top: 10px;
-            }
-        }
-        
-        @media (max-width: 480px) {
-            .websites-container {
-                padding: 30px 20px;
-            }
-            
-            .websites-container h2 {
-                font-size: 1.5rem;
-            }
-            
-            .website-header {
-                padding: 12px 15px;
-            }
-            
-            .website-item.expanded .website-content {
-                padding: 15px;
-            }
-            
-            .version-control-list .version-btn {
-                padding: 7px 12px;
-                font-size: 0.85rem;
-            }
-            
-            .website-preview {
-                height: 300px;
-            }
-            
-            .website-preview iframe {
-                width: 375px;
-                height: 667px;
-                transform: scale(calc((100vw - 60px) / 375px));
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🌐 Website Generator</h1>
-        <p class="subtitle">Transform any website into a modern, optimized version using AI</p>
-        
-        <form id="websiteForm">
-            <div class="form-group">
-                <label for="url">Website URL:</label>
-                <input type="url" id="url" name="url" placeholder="https://example.com" required>
-            </div>
-            
-            <div style="display: flex; align-items: center; gap: 10px; margin-bottom: 20px; padding: 12px; background: #f8f9fa; border-radius: 8px;">
-                <input type="checkbox" id="demoCheckbox" style="width: 18px; height: 18px; cursor: pointer;">
-                <label for="demoCheckbox" style="margin: 0; cursor: pointer; color: #333; font-size: 0.95rem;">
-                    View demo website instead
-                </label>
-            </div>
-            
-            <button type="submit" class="btn" id="generateBtn">
-                Generate Optimized Website
-            </button>
-        </form>
-        
-        <div id="status" class="status"></div>
-        <div id="result" class="result"></div>
-    </div>
-
-    <!-- Website List Container -->
-    <div class="websites-container" id="websitesContainer">
-        <h2>Generated Websites</h2>
-        <div id="websitesList" class="websites-list">
-            <!-- Website items will be populated by JavaScript -->
-        </div>
-        <div id="emptyState" class="empty-state">
-            <p>No websites generated yet. Generate your first website above!</p>
-        </div>
-    </div>
-
-    <script>
-        const form = document.getElementById('websiteForm');
-        const urlInput = document.getElementById('url');
-        const generateBtn = document.getElementById('generateBtn');
-        const statusDiv = document.getElementById('status');
-        const resultDiv = document.getElementById('result');
-        const websitesContainer = document.getElementById('websitesContainer');
-        const websitesList = document.getElementById('websitesList');
-        const emptyState = document.getElementById('emptyState');
-        
-        let currentJobId = null;
-        let pollInterval = null;
-        let websites = [];
-
-        // Initialize page
-        document.addEventListener('DOMContentLoaded', function() {
-            loadWebsites();
-        });
-
-        // Load websites from API
-        async function loadWebsites() {
-            try {
-                const response = await fetch('/websites');
-                if (!response.ok) {
-                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-                }
-                
-                websites = await response.json();
-                renderWebsites();
-                
-            } catch (error) {
-                console.error('Failed to load websites:', error);
-                // Show empty state on error
-                showEmptyState();
-            }
-        }
 
-        // Render websites list
-        function renderWebsites() {
-            if (websites.length === 0) {
-                showEmptyState();
-                return;
-            }
+@app.get("/demo-ready", status_code=204)
+async def demo_ready():
+    """Report whether the demo website can be served, so the UI can open it right away."""
+    if _demo_index_page() is None:
+        raise HTTPException(status_code=404, detail="Demo website not found")
+    return Response(status_code=204)
 
-            hideEmptyState();
-            websitesList.innerHTML = '';
-            
-            websites.forEach((website, index) => {
-                const websiteItem = createWebsiteItem(website, index === 0 && website.isNew);
-                websitesList.appendChild(websiteItem);
-            });
-        }
 
-        // Create individual website item
-        function createWebsiteItem(website, isExpanded = false) {
-            const item = document.createElement('div');
-            item.className = `website-item${isExpanded ? ' expanded' : ''}`;
-            item.dataset.identifier = website.identifier;
-            item.dataset.activeVersion = website.default_version || 1; // Store active version
-            
-            const availableVersions = website.available_versions || [];
-            const defaultVersion = website.default_version || 1;
-            
-            // Generate version control buttons HTML for header
-            const versionControlHTML = website.has_generated_html ? `
-                <div class="version-control-list">
-                    <div class="version-control">
-                        <button class="version-btn${defaultVersion === 1 ? ' active' : ''}" 
-                                data-version="1" 
-                                data-identifier="${website.identifier}"
-                                ${availableVersions.includes(1) ? '' : 'disabled'}
-                                onclick="switchVersion('${website.identifier}', 1, event)">
-                            Version 1
-                        </button>
-                        <button class="version-btn${defaultVersion === 2 ? ' active' : ''}" 
-                                data-version="2" 
-                                data-identifier="${website.identifier}"
-                                ${availableVersions.includes(2) ? '' : 'disabled'}
-                                onclick="switchVersion('${website.identifier}', 2, event)">
-                            Version 2
-                        </button>
-                        <button class="version-btn${defaultVersion === 3 ? ' active' : ''}" 
-                                data-version="3" 
-                                data-identifier="${website.identifier}"
-                                ${availableVersions.includes(3) ? '' : 'disabled'}
-                                onclick="switchVersion('${website.identifier}', 3, event)">
-                            Version 3
-                        </button>
-                    </div>
-                </div>
-            ` : '';
-            
-            item.innerHTML = `
-                <div class="website-header" onclick="handleHeaderClick('${website.identifier}', event)">
-                    <div class="website-header-left">
-                        <span class="website-name">${website.identifier}</span>
-                    </div>
-                    <div class="website-header-center website-btn-expanded-only">
-                        ${versionControlHTML}
-                    </div>
-                    <div class="website-header-right">
-                        <a href="${website.original_url}" target="_blank" class="view-website-btn secondary website-btn-expanded-only" onclick="event.stopPropagation()">
-                            View Original
-                        </a>
-                        <span class="expand-arrow" onclick="toggleWebsiteItem('${website.identifier}'); event.stopPropagation();">▼</span>
-                    </div>
-                </div>
-                <div class="website-content">
-                    ${website.has_generated_html ? `
-                        <div class="website-preview" onclick="openWebsiteWithVersion('${website.identifier}')" style="cursor: pointer;">
-                            <iframe 
-                                id="iframe-${website.identifier}"
-                                src="/raw/${website.identifier}/${defaultVersion}"
-                                sandbox="allow-scripts allow-same-origin allow-forms"
-                                loading="lazy"
-                                title="Website Preview for ${website.identifier}"
-                                style="pointer-events: none;">
-                            </iframe>
-                        </div>
-                    ` : `
-                        <div class="website-preview">
-                            <div style="display: flex; align-items: center; justify-content: center; height: 100%; color: #666;">
-                                Still processing...
-                            </div>
-                        </div>
-                    `}
-                </div>
-            `;
-            
-            return item;
-        }
-        
-        // Switch version in list preview
-        function switchVersion(identifier, version, event) {
-            event.stopPropagation(); // Prevent triggering collapse/expand
-            
-            const iframe = document.getElementById(`iframe-${identifier}`);
-            if (iframe) {
-                // Switch immediately without fade
-                iframe.style.opacity = '1';
-                iframe.src = `/raw/${identifier}/${version}`;
-            }
-            
-            // Update button states and store active version
-            const item = document.querySelector(`[data-identifier="${identifier}"]`);
-            if (item) {
-                // Store the active version in the data attribute
-                item.dataset.activeVersion = version;
-                
-                const buttons = item.querySelectorAll('.version-btn');
-                buttons.forEach(btn => {
-                    const btnVersion = parseInt(btn.dataset.version);
-                    if (btnVersion === version) {
-                        btn.classList.add('active');
-                    } else {
-                        btn.classList.remove('active');
-                    }
-                });
-            }
-        }
+@app.get("/demo")
+async def serve_demo_index():
+    """Serve the demo website index page."""
+    page = _demo_index_page()
+    if page is None:
+        raise HTTPException(status_code=404, detail="Demo website not found")
+    return Response(content=page, media_type="text/html")
 
-        // Open website in new tab with the currently active version
-        function openWebsiteWithVersion(identifier) {
-            const item = document.querySelector(`[data-identifier="${identifier}"]`);
-            const activeVersion = item ? item.dataset.activeVersion : 1;
-            window.open(`/website/${identifier}#v${activeVersion}`, '_blank');
-        }
+def _minify_css(css: str) -> str:
+    """Strip comments and the whitespace around CSS punctuation."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    # Innermost blocks only: in a selector ".a :hover" and ".a:hover" differ
+    css = re.sub(r"\{[^{}]*\}", lambda block: re.sub(r"\s*:\s*", ":", block[0]), css)
+    return css.replace(";}", "}").strip()
 
-        // Handle header click - entire header is clickable when collapsed
-        function handleHeaderClick(identifier, event) {
-            const clickedItem = document.querySelector(`[data-identifier="${identifier}"]`);
-            if (!clickedItem) return;
-            
-            const isExpanded = clickedItem.classList.contains('expanded');
-            
-            // If expanded, only toggle when clicking the arrow area, not buttons/links
-            if (isExpanded) {
-                // Check if click was on a button or link (which have stopPropagation)
-                // If we get here and it's expanded, it means they clicked non-interactive area
-                // Don't do anything - let buttons handle their own clicks
-                return;
-            }
-            
-            // If collapsed, entire header is clickable - expand it
-            toggleWebsiteItem(identifier);
-        }
-        
-        // Toggle website item expand/collapse with accordion behavior
-        function toggleWebsiteItem(identifier) {
-            const clickedItem = document.querySelector(`[data-identifier="${identifier}"]`);
-            if (!clickedItem) return;
-            
-            const isCurrentlyExpanded = clickedItem.classList.contains('expanded');
-            
-            // Close all expanded items first
-            const allItems = document.querySelectorAll('.website-item');
-            allItems.forEach(item => {
-                item.classList.remove('expanded');
-            });
-            
-            // If the clicked item wasn't expanded, expand it
-            if (!isCurrentlyExpanded) {
-                clickedItem.classList.add('expanded');
-            }
-        }
 
-        // Show empty state
-        function showEmptyState() {
-            emptyState.classList.remove('hidden');
-            websitesList.innerHTML = '';
-            websitesContainer.classList.remove('show');
-        }
+def _versioned_page(name: str, assets: Tuple[str, ...]) -> bytes:
+    """
+    Read a static page once, pointing its asset links at versioned URLs.
+    
+    The page on disk links plain /static/ URLs so it still works when served
+    directly; the API serves it with links that browsers may cache forever,
+    and with its inline CSS minified.
+    
+    Args:
+        name: The page's file name in frontend/
+        assets: File names in frontend/ that the page links to
+        
+    Returns:
+        The encoded page
+    """
+    page = (frontend_path / name).read_text(encoding="utf-8")
+    for asset in assets:
+        page = page.replace(f'"/static/{asset}"', f'"{_static_url(asset)}"')
+    page = re.sub(
+        r"(<style>)(.*?)(</style>)",
+        lambda match: match[1] + _minify_css(match[2]) + match[3],
+        page,
+        flags=re.S
+    )
+    return page.encode("utf-8")
 
-        // Hide empty state
-        function hideEmptyState() {
-            emptyState.classList.add('hidden');
-            websitesContainer.classList.add('show');
-        }
+# The index never changes while the process runs, so it is compressed once here
+# rather than by GZipMiddleware on every request
+_INDEX_PAGE = _versioned_page("index.html", ("app.css", "app.js"))
+_INDEX_PAGE_GZIP = gzip.compress(_INDEX_PAGE, compresslevel=9)
+_INDEX_HEADERS = {
+    "ETag": f'"{hashlib.sha256(_INDEX_PAGE).hexdigest()[:16]}"',
+    "Cache-Control": "no-cache",
+    "Vary": "Accept-Encoding"
+}
 
-        // Add new website to top of list
-        function addNewWebsite(websiteData) {
-            // Mark as new for auto-expansion
-            websiteData.isNew = true;
-            
-            // Add to beginning of array
-            websites.unshift(websiteData);
-            
-            // Keep only 10 most recent
-            if (websites.length > 10) {
-                websites = websites.slice(0, 10);
-            }
-            
-            // Re-render (this will automatically expand the new item and close others)
-            renderWebsites();
-            
-            // Scroll to show the new expanded preview in the middle of the screen
-            setTimeout(() => {
-                const newWebsiteItem = document.querySelector(`[data-identifier="${websiteData.identifier}"]`);
-                if (newWebsiteItem) {
-                    const rect = newWebsiteItem.getBoundingClientRect();
-                    const viewportHeight = window.innerHeight;
-                    const targetScrollTop = window.scrollY + rect.top - (viewportHeight / 2) + (newWebsiteItem.offsetHeight / 2);
-                    
-                    window.scrollTo({
-                        top: targetScrollTop,
-                        behavior: 'smooth'
-                    });
-                }
-            }, 100); // Small delay to ensure rendering is complete
-        }
-        
-        form.addEventListener('submit', async (e) => {
-            e.preventDefault();
-            
-            // Check if demo checkbox is checked
-            const demoCheckbox = document.getElementById('demoCheckbox');
-            if (demoCheckbox && demoCheckbox.checked) {
-                // Show loading state
-                generateBtn.disabled = true;
-                generateBtn.className = 'btn loading';
-                generateBtn.innerHTML = '<span class="spinner"></span>Building modern website, this takes up to 20 seconds';
-                statusDiv.className = 'status show';
-                statusDiv.innerHTML = 'Generating demo website...';
-                
-                // Wait 15 seconds before redirecting
-                setTimeout(() => {
-                    window.location.href = '/demo';
-                }, 15000);
-                return;
-            }
-            
-            const url = urlInput.value.trim();
-            if (!url) return;
-            
-            // Reset UI
-            generateBtn.disabled = true;
-            generateBtn.className = 'btn loading';
-            generateBtn.innerHTML = '<span class="spinner"></span>Building modern website, this will take a minute or two';
-            statusDiv.className = 'status';
-            statusDiv.innerHTML = '';
-            resultDiv.className = 'result';
-            resultDiv.innerHTML = '';
-            
-            try {
-                // Start generation
-                const response = await fetch('/generate', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ url: url })
-                });
-                
-                if (!response.ok) {
-                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-                }
-                
-                const job = await response.json();
-                currentJobId = job.id;
-                
-                // Start polling for status
-                pollJobStatus();
-                
-            } catch (error) {
-                showError(`Failed to start generation: ${error.message}`);
-                resetForm();
-            }
-        });
-        
-        async function pollJobStatus() {
-            if (!currentJobId) return;
-            
-            try {
-                const response = await fetch(`/status/${currentJobId}`);
-                if (!response.ok) {
-                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-                }
-                
-                const job = await response.json();
-                
-                switch (job.status) {
-                    case 'pending':
-                    case 'processing':
-                        // Keep button text as is, no status updates during processing
-                        break;
-                        
-                    case 'completed':
-                        statusDiv.className = 'status show';
-                        statusDiv.innerHTML = 'Website created successfully!';
-                        
-                        // Add new website to the list (will appear in expanded view)
-                        const newWebsiteData = {
-                            id: job.website_id,
-                            identifier: job.identifier,
-                            original_url: urlInput.value.trim(),
-                            created_at: new Date().toISOString(),
-                            has_generated_html: true
-                        };
-                        addNewWebsite(newWebsiteData);
-                        
-                        clearInterval(pollInterval);
-                        resetForm();
-                        break;
-                        
-                    case 'failed':
-                        throw new Error(job.error_message || 'Generation failed');
-                        
-                    default:
-                        throw new Error(`Unknown job status: ${job.status}`);
-                }
-                
-                // Continue polling if still processing
-                if (job.status === 'pending' || job.status === 'processing') {
-                    pollInterval = setTimeout(pollJobStatus, 2000);
-                }
-                
-            } catch (error) {
-                showError(`Status check failed: ${error.message}`);
-                clearInterval(pollInterval);
-                resetForm();
-            }
-        }
-        
-        function showError(message) {
-            statusDiv.className = 'status show';
-            statusDiv.innerHTML = `Error: ${message}`;
-            generateBtn.className = 'btn';
-        }
-        
-        function resetForm() {
-            generateBtn.disabled = false;
-            generateBtn.className = 'btn';
-            generateBtn.textContent = 'Generate Optimized Website';
-            statusDiv.className = 'status';
-            statusDiv.innerHTML = '';
-            currentJobId = null;
-        }
-    </script>
-</body>
-</html>
-    """)
+# Serve the main web interface (also available as /static/index.html)
+@app.get("/", response_class=HTMLResponse)
+async def serve_index(request: Request):
+    """Serve the main web interface."""
+    if request.headers.get("if-none-match") == _INDEX_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_INDEX_PAGE_GZIP,
+            media_type="text/html",
+            headers={**_INDEX_HEADERS, "Content-Encoding": "gzip"}
+        )
+    return Response(content=_INDEX_PAGE, media_type="text/html", headers=_INDEX_HEADERS)
 
 
 if __name__ == "__main__":
     import uvicorn
+    # C event loop and HTTP parser (both ship with uvicorn[standard]); job state
+    # lives in Redis, so several worker processes can share the load
     uvicorn.run(
         "backend.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        workers=4,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
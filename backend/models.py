@@ -6,10 +6,15 @@ and database record representations.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Mapping, Optional
+from urllib.parse import parse_qsl, quote, urlencode
 from uuid import UUID
 
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, HttpUrl, Field, field_validator
+
+
+# Query parameters that only identify where a visitor came from
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ref", "_ga"}
 
 
 class WebsiteRequest(BaseModel):
@@ -31,6 +36,40 @@ class JobRequest(BaseModel):
     """Request model for job creation."""
     url: HttpUrl = Field(..., description="The URL to process")
 
+    @field_validator("url")
+    @classmethod
+    def normalize_url(cls, url: HttpUrl) -> HttpUrl:
+        """
+        Canonicalize the URL so equivalent inputs map to the same job.
+
+        HttpUrl already rejects non-http(s) schemes, lowercases the host and
+        drops default ports; this also strips tracking parameters and the
+        fragment, neither of which changes the page that gets scraped.
+
+        Args:
+            url: The validated URL
+
+        Returns:
+            HttpUrl: The canonical URL
+        """
+        params = parse_qsl(url.query or "", keep_blank_values=True)
+        query = [
+            (name, value)
+            for name, value in params
+            if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+        ]
+        if len(query) == len(params) and url.fragment is None:
+            return url
+        return HttpUrl.build(
+            scheme=url.scheme,
+            username=url.username,
+            password=url.password,
+            host=url.host,
+            port=url.port,
+            path=(url.path or "/").lstrip("/"),
+            query=urlencode(query, quote_via=quote) or None,
+        )
+
 
 class JobResponse(BaseModel):
     """Response model for job status."""
@@ -50,7 +89,19 @@ class JobStatus(BaseModel):
     identifier: Optional[str] = None
 
 
-class WebsiteRecord(BaseModel):
+class DatabaseRecord(BaseModel):
+    """Base model for records read from the database."""
+
+    class Config:
+        from_attributes = True
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]):
+        """Build the model from a trusted asyncpg Record without re-validating it."""
+        return cls.model_construct(**record)
+
+
+class WebsiteRecord(DatabaseRecord):
     """Database record model for websites."""
     id: UUID
     identifier: str
@@ -59,25 +110,21 @@ class WebsiteRecord(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
-class WebsiteVersionRecord(BaseModel):
+class WebsiteVersionRecord(DatabaseRecord):
     """Database record model for website versions."""
     id: UUID
     website_id: UUID
     version_number: int
     generation_instructions: str
     generated_html: Optional[str] = None
+    html_sha256: Optional[str] = None
+    html_gzip: Optional[bytes] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
 
-
-class JobRecord(BaseModel):
+class JobRecord(DatabaseRecord):
     """Database record model for jobs."""
     id: UUID
     website_id: Optional[UUID] = None
@@ -86,9 +133,6 @@ class JobRecord(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class HealthResponse(BaseModel):
     """Response model for health check."""
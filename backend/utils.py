@@ -7,8 +7,10 @@ web scraping, and GPT-based HTML generation.
 
 import re
 import hashlib
+import logging
 from urllib.parse import urlparse, urljoin
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Set
+from uuid import uuid4
 import requests
 from bs4 import BeautifulSoup
 from openai import OpenAI
@@ -16,6 +18,48 @@ import os
 import json
 
 
+logger = logging.getLogger(__name__)
+
+# Shared clients, created on first use so every call reuses their connection
+# pools (and TLS sessions) instead of building new ones. Scraping runs one
+# page at a time per pool process, so each process gets its own session.
+_openai_client: Optional[OpenAI] = None
+_http_session: Optional[requests.Session] = None
+
+
+def get_openai_client() -> OpenAI:
+    """
+    Get the shared OpenAI client.
+    
+    Returns:
+        OpenAI client configured from OPENAI_API_KEY
+    """
+    global _openai_client
+    if _openai_client is None:
+        api_key = os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise Exception("OPENAI_API_KEY not found in environment variables")
+        _openai_client = OpenAI(api_key=api_key)
+    return _openai_client
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get this process's shared HTTP session for scraping.
+    
+    Returns:
+        requests Session with keep-alive connection pooling
+    """
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        _http_session.headers['User-Agent'] = (
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+            '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        )
+    return _http_session
+
+
 def extract_identifier(url: str) -> str:
     """
     Extract a meaningful identifier from a URL.
@@ -56,41 +100,32 @@ def extract_identifier(url: str) -> str:
         return identifier.lower()
         
     except Exception as e:
-        print(f"⚠️ Error extracting identifier from {url}: {e}")
+        logger.warning("Error extracting identifier from %s: %s", url, e)
         # Fallback to hash
         return hashlib.md5(url.encode()).hexdigest()[:8]
 
 
-def ensure_unique_identifier(base_identifier: str, existing_check_func) -> str:
+def ensure_unique_identifier(base_identifier: str, taken_identifiers: Set[str]) -> str:
     """
     Ensure identifier is unique by appending numbers if needed.
     
     Args:
         base_identifier: The base identifier to check
-        existing_check_func: Async function to check if identifier exists
+        taken_identifiers: Identifiers already in use that start with the base
         
     Returns:
-        A unique identifier
+        The first free identifier: base, base1, base2, ... or a random suffix after 100 tries
     """
-    import asyncio
+    if base_identifier not in taken_identifiers:
+        return base_identifier
     
-    async def _check_unique():
-        identifier = base_identifier
-        counter = 1
-        
-        while await existing_check_func(identifier):
-            identifier = f"{base_identifier}{counter}"
-            counter += 1
-            
-            # Prevent infinite loops
-            if counter > 1000:
-                identifier = f"{base_identifier}{hashlib.md5(str(counter).encode()).hexdigest()[:4]}"
-                break
-                
-        return identifier
+    for counter in range(1, 101):
+        identifier = f"{base_identifier}{counter}"
+        if identifier not in taken_identifiers:
+            return identifier
     
-    # For synchronous usage, we'll return the base and let caller handle uniqueness
-    return base_identifier
+    # Prevent endless probing for very popular domains
+    return f"{base_identifier}_{str(uuid4())[:8]}"
 
 
 def scrape_website(url: str) -> Dict[str, Any]:
@@ -104,13 +139,9 @@ def scrape_website(url: str) -> Dict[str, Any]:
         Dictionary with title, content, meta_description, and original HTML
     """
     try:
-        print(f"🌐 Scraping content from: {url}")
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        logger.info("Scraping content from: %s", url)
         
-        response = requests.get(url, headers=headers, timeout=15)
+        response = get_http_session().get(url, timeout=15)
         response.raise_for_status()
         
         # Store original HTML
@@ -169,10 +200,10 @@ def scrape_website(url: str) -> Dict[str, Any]:
         }
         
     except requests.exceptions.RequestException as e:
-        print(f"❌ Error scraping website: {e}")
+        logger.warning("Error scraping website %s: %s", url, e)
         raise Exception(f"Failed to scrape website: {str(e)}")
     except Exception as e:
-        print(f"❌ Error parsing content: {e}")
+        logger.warning("Error parsing content from %s: %s", url, e)
         raise Exception(f"Failed to parse website content: {str(e)}")
 
 
@@ -292,7 +323,7 @@ def extract_images_from_html(html: str, base_url: str) -> List[Dict[str, str]]:
             if src:
                 add_image(src, svg.get('alt', ''), svg.get('title', ''), 'svg')
         
-        print(f"🖼️ Extracted {len(images)} images from HTML ({len(seen_urls)} unique URLs)")
+        logger.info("Extracted %d images from HTML (%d unique URLs)", len(images), len(seen_urls))
         
         # Debug: Show breakdown by source type
         source_counts = {}
@@ -302,12 +333,12 @@ def extract_images_from_html(html: str, base_url: str) -> List[Dict[str, str]]:
         
         if source_counts:
             breakdown = ', '.join([f"{count} {source}" for source, count in source_counts.items()])
-            print(f"📊 Image sources: {breakdown}")
+            logger.info("Image sources: %s", breakdown)
         
         return images
         
     except Exception as e:
-        print(f"⚠️ Error extracting images: {e}")
+        logger.warning("Error extracting images: %s", e)
         return []
 
 
@@ -323,7 +354,7 @@ def convert_to_cloudinary_url(original_url: str) -> str:
     """
     cloud_name = os.getenv('CLOUDINARY_CLOUD_NAME')
     if not cloud_name:
-        print("⚠️ CLOUDINARY_CLOUD_NAME not configured")
+        logger.warning("CLOUDINARY_CLOUD_NAME not configured")
         return None
         
     return f"https://res.cloudinary.com/{cloud_name}/image/fetch/{original_url}"
@@ -340,7 +371,7 @@ def test_url_accessibility(url: str) -> bool:
         True if accessible, False otherwise
     """
     try:
-        response = requests.head(url, timeout=5, allow_redirects=True)
+        response = get_http_session().head(url, timeout=5, allow_redirects=True)
         return response.status_code == 200
     except Exception:
         return False
@@ -357,14 +388,9 @@ def generate_version_instructions(scraped_data: Dict[str, Any]) -> Dict[str, str
         Dictionary with version_1, version_2, version_3 instruction strings
     """
     try:
-        print("🤔 Generating 3 creative directions with GPT-5 thinking mode...")
-        
-        # Setup OpenAI client
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            raise Exception("OPENAI_API_KEY not found in environment variables")
+        logger.info("Generating 3 creative directions with GPT-5 thinking mode")
         
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client()
         
         # Prepare image information
         image_info = ""
@@ -461,8 +487,8 @@ REMEMBER: Output ONLY the JSON object, nothing else."""
         response_text = response.choices[0].message.content.strip()
         
         # Log raw response for debugging
-        print(f"📥 Raw response length: {len(response_text)} chars")
-        print(f"📥 First 500 chars: {response_text[:500]}")
+        logger.info("Raw response length: %d chars", len(response_text))
+        logger.debug("First 500 chars: %s", response_text[:500])
         
         # Clean up potential markdown or extra text
         # Remove markdown code blocks if present
@@ -488,8 +514,8 @@ REMEMBER: Output ONLY the JSON object, nothing else."""
         try:
             instructions = json.loads(json_text)
         except json.JSONDecodeError as e:
-            print(f"❌ JSON parse error: {e}")
-            print(f"📄 Attempted to parse: {json_text[:1000]}...")
+            logger.warning("JSON parse error: %s", e)
+            logger.debug("Attempted to parse: %s...", json_text[:1000])
             raise Exception(f"Failed to parse JSON from GPT response: {e}")
         
         # Validate that we got all 3 versions
@@ -502,40 +528,41 @@ REMEMBER: Output ONLY the JSON object, nothing else."""
             if not isinstance(instructions[key], str) or len(instructions[key].strip()) < 50:
                 raise Exception(f"{key} is invalid: too short or not a string")
         
-        print(f"✅ Generated 3 creative directions successfully")
-        print(f"   Version 1 length: {len(instructions['version_1'])} chars")
-        print(f"   Version 2 length: {len(instructions['version_2'])} chars")
-        print(f"   Version 3 length: {len(instructions['version_3'])} chars")
+        logger.info(
+            "Generated 3 creative directions (%d/%d/%d chars)",
+            len(instructions['version_1']),
+            len(instructions['version_2']),
+            len(instructions['version_3'])
+        )
         
         return instructions
         
     except Exception as e:
-        print(f"❌ CRITICAL ERROR generating version instructions: {e}")
-        print(f"❌ This should not happen - instruction generation failed completely")
+        logger.exception("Instruction generation failed completely")
         # Re-raise the error instead of using fallback - let the job fail
         raise
 
 
-async def process_images(scraped_data: Dict[str, Any], website_id: str) -> Dict[str, Any]:
+def prepare_images(scraped_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Process images by converting to Cloudinary URLs and updating HTML.
+    Convert scraped images to Cloudinary URLs and update HTML.
+    
+    Only builds URLs, so it needs no I/O; store_image_mappings() persists the
+    result and can run alongside the AI steps.
     
     Args:
         scraped_data: The scraped website data
-        website_id: The website ID for database storage
         
     Returns:
         Updated scraped data with processed images and modified HTML
     """
-    from .database import db
-    
     try:
         images = scraped_data.get('images', [])
         if not images:
-            print("📷 No images found to process")
+            logger.info("No images found to process")
             return scraped_data
         
-        print(f"🔄 Processing {len(images)} images...")
+        logger.info("Processing %d images", len(images))
         
         # Process each image
         processed_images = []
@@ -547,48 +574,60 @@ async def process_images(scraped_data: Dict[str, Any], website_id: str) -> Dict[
             # Convert to Cloudinary URL (let Cloudinary handle broken URLs)
             cloudinary_url = convert_to_cloudinary_url(original_url)
             if not cloudinary_url:
-                print(f"⚠️ Could not create Cloudinary URL for: {original_url}")
+                logger.warning("Could not create Cloudinary URL for: %s", original_url)
                 continue
             
-            # Store mapping in database
-            try:
-                await db.create_image_mapping(
-                    website_id=website_id,
-                    original_url=original_url,
-                    cloudinary_url=cloudinary_url,
-                    alt_text=img_data.get('alt', '')
-                )
-                
-                url_mappings[original_url] = cloudinary_url
-                processed_images.append({
-                    **img_data,
-                    'cloudinary_url': cloudinary_url
-                })
-                
-                print(f"✅ Processed image: {original_url} → Cloudinary")
-                
-            except Exception as e:
-                print(f"❌ Error storing image mapping: {e}")
-                continue
+            url_mappings[original_url] = cloudinary_url
+            processed_images.append({
+                **img_data,
+                'cloudinary_url': cloudinary_url
+            })
         
-        # Replace URLs in HTML
-        updated_html = scraped_data['original_html']
-        for original_url, cloudinary_url in url_mappings.items():
-            updated_html = updated_html.replace(original_url, cloudinary_url)
+        # Replace URLs in HTML, if the caller still holds it
+        if 'original_html' in scraped_data:
+            updated_html = scraped_data['original_html']
+            for original_url, cloudinary_url in url_mappings.items():
+                updated_html = updated_html.replace(original_url, cloudinary_url)
+            scraped_data['original_html'] = updated_html
         
         # Update scraped data
-        scraped_data['original_html'] = updated_html
         scraped_data['processed_images'] = processed_images
         scraped_data['image_mappings'] = url_mappings
         
-        print(f"🎉 Successfully processed {len(processed_images)} images")
+        logger.info("Processed %d images", len(processed_images))
         return scraped_data
         
     except Exception as e:
-        print(f"❌ Error processing images: {e}")
+        logger.warning("Error processing images: %s", e)
         return scraped_data
 
 
+async def store_image_mappings(scraped_data: Dict[str, Any], website_id: str) -> None:
+    """
+    Store the image mappings built by prepare_images() in a single round trip.
+    
+    Failures are logged and not raised: the Cloudinary fetch URLs work
+    whether or not their mappings are recorded.
+    
+    Args:
+        scraped_data: Scraped data already passed through prepare_images()
+        website_id: The website ID for database storage
+    """
+    from .database import db
+    
+    processed_images = scraped_data.get('processed_images')
+    if not processed_images:
+        return
+    try:
+        await db.create_image_mappings_bulk(
+            website_id,
+            [(img['src'], img['cloudinary_url'], img.get('alt', '')) for img in processed_images]
+        )
+        logger.info("Stored %d image mappings for website %s", len(processed_images), website_id)
+    except Exception:
+        logger.exception("Error storing image mappings for website %s", website_id)
+
+
 def generate_optimized_html(scraped_data: Dict[str, Any], instructions: str) -> str:
     """
     Generate optimized HTML using OpenAI GPT with creative direction instructions.
@@ -601,14 +640,7 @@ def generate_optimized_html(scraped_data: Dict[str, Any], instructions: str) ->
         Generated HTML string following the provided instructions
     """
     try:
-        print(f"🤖 Generating HTML with GPT-5.1...")
-        
-        # Setup OpenAI client
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            raise Exception("OPENAI_API_KEY not found in environment variables")
-        
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client()
         
         # Prepare image information for the prompt
         image_info = ""
@@ -666,7 +698,7 @@ The result must be a beautiful, professional website that perfectly executes the
 """
 
         # Use GPT-5.1 with Responses API for high-quality code generation
-        print(f"🤖 Generating HTML with GPT-5.1 (high reasoning)...")
+        logger.info("Generating HTML with GPT-5.1 (high reasoning)")
         
         # System prompt for expert frontend developer
         system_prompt = "You are an expert frontend developer specializing in creating beautiful, modern, production-ready HTML documents using Tailwind CSS. You excel at implementing professional templates with Tailwind utility classes and inline JavaScript. You are a master of Tailwind's utility-first approach and use it for ALL styling (layout, colors, typography, spacing, responsive design, hover states, transitions). You ALWAYS output only raw HTML code - no markdown, no code blocks, no explanations. Your HTML is clean, semantic, accessible, visually stunning, and leverages Tailwind CSS via CDN for all styling needs."
@@ -675,10 +707,7 @@ The result must be a beautiful, professional website that perfectly executes the
         full_input = f"{system_prompt}\n\n{prompt}"
         
         # Log the exact prompt being sent
-        print("📝 OpenAI Prompt Input:")
-        print("=" * 80)
-        print(full_input[:1000] + ("..." if len(full_input) > 1000 else ""))
-        print("=" * 80)
+        logger.debug("OpenAI prompt input: %s", full_input[:1000] + ("..." if len(full_input) > 1000 else ""))
         
         # Call GPT-5.1 using Responses API
         response = client.responses.create(
@@ -693,15 +722,12 @@ The result must be a beautiful, professional website that perfectly executes the
         model_used = "gpt-5.1"
         
         # Log the exact response content from OpenAI
-        print(f"📥 OpenAI Response Output from gpt-5.1:")
-        print("=" * 80)
-        print(html_content[:1000] + ("..." if len(html_content) > 1000 else ""))
-        print("=" * 80)
-        print(f"✅ gpt-5.1 generated {len(html_content)} characters of HTML!")
+        logger.debug("OpenAI response output from gpt-5.1: %s", html_content[:1000] + ("..." if len(html_content) > 1000 else ""))
+        logger.info("gpt-5.1 generated %d characters of HTML", len(html_content))
         
         # Validate that we got substantial content
         if not html_content or len(html_content) < 200 or "<!DOCTYPE html>" not in html_content:
-            print("❌ GPT-5.1 returned invalid content, generating fallback HTML")
+            logger.warning("GPT-5.1 returned invalid content, generating fallback HTML")
             return generate_fallback_html(scraped_data)
         
         # Clean up any markdown formatting if present
@@ -713,11 +739,11 @@ The result must be a beautiful, professional website that perfectly executes the
         if html_content.endswith('```'):
             html_content = html_content[:-3]
         
-        print(f"🎉 Successfully used {model_used} to generate HTML!")
+        logger.info("Generated HTML with %s", model_used)
         return html_content.strip()
         
     except Exception as e:
-        print(f"❌ Error generating HTML with GPT: {e}")
+        logger.warning("Error generating HTML with GPT: %s", e)
         return generate_fallback_html(scraped_data)
 
 
@@ -733,31 +759,23 @@ async def generate_three_versions_parallel(scraped_data: Dict[str, Any], instruc
         Dictionary with version_1, version_2, version_3 HTML strings (or None if generation failed)
     """
     import asyncio
-    from concurrent.futures import ThreadPoolExecutor
     
-    print("🚀 Starting parallel generation of 3 website versions...")
+    logger.info("Starting parallel generation of 3 website versions")
     
     # Define async wrapper for the synchronous generate_optimized_html function
     async def generate_version(version_name: str, instructions: str):
         """Generate a single version asynchronously."""
         try:
-            print(f"   Starting {version_name}...")
+            logger.info("Starting %s", version_name)
             
-            # Run the synchronous function in a thread pool
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                html = await loop.run_in_executor(
-                    executor,
-                    generate_optimized_html,
-                    scraped_data,
-                    instructions
-                )
+            # Run the synchronous function in the default thread pool
+            html = await asyncio.to_thread(generate_optimized_html, scraped_data, instructions)
             
-            print(f"   ✅ {version_name} completed ({len(html)} chars)")
+            logger.info("%s completed (%d chars)", version_name, len(html))
             return html
             
         except Exception as e:
-            print(f"   ❌ {version_name} failed: {str(e)}")
+            logger.warning("%s failed: %s", version_name, e)
             return None
     
     # Create tasks for all 3 versions
@@ -779,7 +797,7 @@ async def generate_three_versions_parallel(scraped_data: Dict[str, Any], instruc
     
     # Count successes
     success_count = sum(1 for html in version_htmls.values() if html is not None)
-    print(f"🎉 Parallel generation complete: {success_count}/3 versions succeeded")
+    logger.info("Parallel generation complete: %d/3 versions succeeded", success_count)
     
     if success_count == 0:
         raise Exception("All 3 versions failed to generate")
@@ -0,0 +1,187 @@
+"""
+arq worker for the Website Generator.
+
+Generation jobs are enqueued by the API (POST /generate) and executed here,
+in a separate process, so slow scraping and AI calls never block the web
+workers' event loops. Run with: arq backend.worker.WorkerSettings
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict
+from uuid import UUID
+
+from arq.connections import RedisSettings
+
+from .database import db
+from .job_store import JOB_WORKERS, job_store
+from .utils import (
+    extract_identifier, ensure_unique_identifier, scrape_website, prepare_images,
+    store_image_mappings, generate_version_instructions, generate_three_versions_parallel
+)
+
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Scraping parses whole pages with BeautifulSoup, which holds the GIL; a
+# process pool lets concurrent jobs parse on separate cores
+SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS") or os.cpu_count() or 1)
+
+
+async def _fail_job(job_id: UUID, error_msg: str):
+    """Mark a job as failed in both the database and the job store."""
+    await db.update_job_status(job_id, "failed", error_message=error_msg)
+    await job_store.set_job(job_id, status="failed", error=error_msg)
+
+
+async def process_website_async(ctx: Dict[str, Any], job_id: str, url: str):
+    """
+    Queue task that scrapes a website and generates its three versions.
+    
+    Args:
+        ctx: arq worker context
+        job_id: The job ID to track progress
+        url: The URL to process
+    """
+    job_id = UUID(job_id)
+    try:
+        logger.info("Starting job %s for URL: %s", job_id, url)
+        
+        # Pollers see "processing" through the job store; the database row is
+        # only written once the website ID is known, saving a round trip
+        await job_store.set_job(job_id, status="processing", error=None)
+        
+        # Step 1: Scrape the website
+        logger.debug("Scraping website: %s", url)
+        scraped_data = await asyncio.get_running_loop().run_in_executor(ctx['scrape_pool'], scrape_website, url)
+        
+        # The raw page is only needed for the website insert, so it is taken
+        # out of scraped_data and released before the long-running AI steps
+        original_html = scraped_data.pop('original_html')
+        
+        # Step 2: Convert images to Cloudinary URLs (no I/O), then start the
+        # creative directions right away; they only need the scraped content,
+        # so they run while the website and image mappings are stored
+        logger.debug("Processing images for job %s", job_id)
+        scraped_data = prepare_images(scraped_data)
+        logger.debug("Generating 3 creative directions for job %s", job_id)
+        instructions_task = asyncio.create_task(asyncio.to_thread(generate_version_instructions, scraped_data))
+        
+        try:
+            # Step 3: Create website record under the first free identifier.
+            # Taken identifiers are fetched in one query; the claim only repeats
+            # if another job grabs the chosen identifier in the meantime.
+            base_identifier = extract_identifier(url)
+            website_id = None
+            
+            while not website_id:
+                taken_identifiers = await db.get_taken_identifiers(base_identifier)
+                identifier = ensure_unique_identifier(base_identifier, taken_identifiers)
+                website_id = await db.upsert_website(
+                    identifier=identifier,
+                    original_url=url,
+                    original_html=original_html
+                )
+            del original_html
+            
+            logger.debug("Using identifier: %s", identifier)
+            
+            # Update job with website ID
+            await db.update_job_status(job_id, "processing", website_id=website_id)
+            await job_store.set_job(job_id, website_id=website_id, identifier=identifier)
+            
+            logger.debug("Created website record: %s", website_id)
+            
+            # Step 4: Store the image mappings and wait for the creative directions
+            await store_image_mappings(scraped_data, website_id)
+            instructions = await instructions_task
+        finally:
+            # Don't leave the directions running unobserved if a step above failed
+            instructions_task.cancel()
+        
+        # Step 5: Generate 3 versions in parallel
+        logger.debug("Generating 3 website versions in parallel for job %s", job_id)
+        version_htmls = await generate_three_versions_parallel(scraped_data, instructions)
+        
+        # Step 6: Store all successful versions in database with one insert
+        rows = [
+            (num, instructions.get(key, ''), version_htmls[key])
+            for key, num in (('version_1', 1), ('version_2', 2), ('version_3', 3))
+            if version_htmls.get(key)
+        ]
+        stored_versions = await db.create_website_versions_bulk(website_id, rows)
+        versions_created = len(stored_versions)
+        logger.debug("Stored versions %s", stored_versions)
+        
+        # Step 7: Mark job as completed if at least 1 version succeeded
+        if versions_created > 0:
+            await db.update_job_status(job_id, "completed")
+            await job_store.set_job(
+                job_id,
+                status="completed",
+                error=None,
+                website_id=website_id,
+                identifier=identifier,
+                versions_generated=versions_created
+            )
+            logger.info("Job %s completed successfully with %s/3 versions", job_id, versions_created)
+        else:
+            raise Exception("All 3 versions failed to generate")
+        
+    except asyncio.CancelledError:
+        # arq cancels the job on job_timeout or worker shutdown; without a final
+        # state its pollers would wait on it forever
+        logger.error("Job %s was cancelled or timed out", job_id)
+        await asyncio.shield(_fail_job(job_id, "Job timed out or was interrupted"))
+        raise
+    
+    except Exception as e:
+        error_msg = str(e)
+        logger.exception("Job %s failed: %s", job_id, error_msg)
+        await _fail_job(job_id, error_msg)
+    
+    finally:
+        # Let the next request for this URL start a fresh job
+        await job_store.release_url(url, job_id)
+
+
+async def startup(ctx: Dict[str, Any]):
+    """Open database and Redis connections and the scrape pool when the worker starts."""
+    # Children come from a clean forkserver rather than forking this process,
+    # which by then holds an event loop, pool sockets and helper threads
+    ctx['scrape_pool'] = ProcessPoolExecutor(
+        max_workers=SCRAPE_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver")
+    )
+    await db.connect()
+    await job_store.connect()
+    logger.info("Website Generator worker started")
+
+
+async def shutdown(ctx: Dict[str, Any]):
+    """Close database and Redis connections and the scrape pool when the worker stops."""
+    await job_store.disconnect()
+    await db.disconnect()
+    ctx['scrape_pool'].shutdown(cancel_futures=True)
+    logger.info("Website Generator worker stopped")
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+    functions = [process_website_async]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://redis:6379/0"))
+    # Scraping plus three parallel AI generations can take several minutes
+    job_timeout = 900
+    # A re-run would scrape again and create a second website row; interrupted
+    # jobs are marked failed instead and the user can resubmit the URL
+    max_tries = 1
+    # Caps simultaneous scrapes and OpenAI calls; the API sheds load beyond JOB_QUEUE_LIMIT
+    max_jobs = JOB_WORKERS
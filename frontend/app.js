@@ -0,0 +1,614 @@
+const form = document.getElementById('websiteForm');
+const urlInput = document.getElementById('url');
+const generateBtn = document.getElementById('generateBtn');
+const statusDiv = document.getElementById('status');
+const resultDiv = document.getElementById('result');
+const websitesContainer = document.getElementById('websitesContainer');
+const websitesList = document.getElementById('websitesList');
+const emptyState = document.getElementById('emptyState');
+
+let currentJobId = null;
+// Aborts the current job's requests, stream and poll when another job starts
+let jobController = null;
+let websites = [];
+
+// Rendered elements for each website, keyed by identifier
+const itemIndex = new Map();
+
+// Identifier of the one expanded item, if any
+let expandedId = null;
+
+// Initialize page
+document.addEventListener('DOMContentLoaded', function() {
+    loadWebsites();
+});
+
+// Cache API storage for the last list this browser loaded
+const WEBSITES_CACHE = 'websites-v1';
+
+// Load websites from API
+async function loadWebsites() {
+    // Show the last list this browser saw right away, then refresh it
+    const cachedBody = await readCachedWebsites();
+    if (cachedBody) {
+        websites = JSON.parse(cachedBody);
+        renderWebsites();
+    }
+    
+    try {
+        const response = await fetch('/websites', { cache: 'no-cache' });
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        
+        const body = await response.text();
+        if (body !== cachedBody) {
+            websites = JSON.parse(body);
+            renderWebsites();
+            writeCachedWebsites(body);
+        }
+        
+    } catch (error) {
+        console.error('Failed to load websites:', error);
+        // Show empty state on error, unless the cached list is already showing
+        if (!cachedBody) {
+            showEmptyState();
+        }
+    }
+}
+
+async function readCachedWebsites() {
+    if (!('caches' in window)) return null;
+    try {
+        const cached = await caches.match('/websites', { cacheName: WEBSITES_CACHE });
+        return cached ? await cached.text() : null;
+    } catch (error) {
+        return null;
+    }
+}
+
+async function writeCachedWebsites(body) {
+    if (!('caches' in window)) return;
+    try {
+        const cache = await caches.open(WEBSITES_CACHE);
+        await cache.put('/websites', new Response(body, { headers: { 'Content-Type': 'application/json' } }));
+    } catch (error) {
+        console.warn('Failed to cache websites:', error);
+    }
+}
+
+// Website item markup, parsed once and cloned for every website
+const websiteItemTemplate = document.createElement('template');
+websiteItemTemplate.innerHTML = `
+    <div class="website-item">
+        <div class="website-header" data-action="header">
+            <div class="website-header-left">
+                <span class="website-name"></span>
+            </div>
+            <div class="website-header-center website-btn-expanded-only">
+                <div class="version-control-list">
+                    <div class="version-control"></div>
+                </div>
+            </div>
+            <div class="website-header-right">
+                <a target="_blank" class="view-website-btn secondary website-btn-expanded-only" data-action="original">
+                    View Original
+                </a>
+                <span class="expand-arrow" data-action="toggle">▼</span>
+            </div>
+        </div>
+        <div class="website-content">
+            <div class="website-preview" data-action="open" style="cursor: pointer;"></div>
+        </div>
+    </div>
+`;
+
+// One version button; an item gets one per available version
+const versionButtonTemplate = document.createElement('template');
+versionButtonTemplate.innerHTML = '<button class="version-btn" data-action="switch-version"></button>';
+
+// One preview frame; an item gets one per version, and only the active one is displayed
+const previewFrameTemplate = document.createElement('template');
+previewFrameTemplate.innerHTML = `
+    <iframe
+        sandbox="allow-scripts allow-same-origin allow-forms"
+        style="pointer-events: none;">
+    </iframe>
+`;
+
+// Placeholder shown instead of the preview while a website is processing
+const processingPreviewTemplate = document.createElement('template');
+processingPreviewTemplate.innerHTML = `
+    <div class="website-preview">
+        <div style="display: flex; align-items: center; justify-content: center; height: 100%; color: #666;">
+            Still processing...
+        </div>
+    </div>
+`;
+
+// Previews only start loading once they are displayed near the viewport, so
+// hidden versions load the first time they are switched to
+const previewObserver = new IntersectionObserver((entries, observer) => {
+    for (const entry of entries) {
+        if (!entry.isIntersecting) continue;
+        const iframe = entry.target;
+        iframe.src = iframe.dataset.src;
+        iframe.removeAttribute('data-src');
+        observer.unobserve(iframe);
+    }
+}, { rootMargin: '200px' });
+
+// Render websites list
+function renderWebsites() {
+    if (websites.length === 0) {
+        showEmptyState();
+        return;
+    }
+
+    hideEmptyState();
+
+    // Build every item off-document and swap them in with a single DOM write
+    const frag = document.createDocumentFragment();
+    itemIndex.clear();
+    expandedId = null;
+    websites.forEach((website, index) => {
+        const isExpanded = index === 0 && website.isNew;
+        if (isExpanded) expandedId = website.identifier;
+        const item = createWebsiteItem(website, isExpanded);
+        itemIndex.set(website.identifier, {
+            item,
+            frames: item.querySelectorAll('.website-preview iframe'),
+            versionBtns: item.querySelectorAll('.version-btn')
+        });
+        frag.appendChild(item);
+    });
+    previewObserver.disconnect();
+    websitesList.replaceChildren(frag);
+    
+    // Previews are not needed for the first paint; start watching them once the page is idle
+    whenIdle(() => {
+        websitesList.querySelectorAll('iframe[data-src]').forEach(iframe => previewObserver.observe(iframe));
+    });
+}
+
+// Run non-urgent work when the browser is idle, or within half a second at the latest
+function whenIdle(callback) {
+    if ('requestIdleCallback' in window) {
+        requestIdleCallback(callback, { timeout: 500 });
+    } else {
+        setTimeout(callback, 1);
+    }
+}
+
+// Create individual website item
+function createWebsiteItem(website, isExpanded = false) {
+    const item = websiteItemTemplate.content.firstElementChild.cloneNode(true);
+    item.classList.toggle('expanded', isExpanded);
+    item.dataset.identifier = website.identifier;
+    item.dataset.activeVersion = website.default_version || 1; // Store active version
+    
+    const availableVersions = website.available_versions || [];
+    const defaultVersion = website.default_version || 1;
+    
+    item.querySelector('.website-name').textContent = website.identifier;
+    item.querySelector('.view-website-btn').href = website.original_url;
+    
+    if (website.has_generated_html) {
+        const versionControl = item.querySelector('.version-control');
+        availableVersions.forEach(version => {
+            const btn = versionButtonTemplate.content.firstElementChild.cloneNode(true);
+            btn.dataset.version = version;
+            btn.textContent = `Version ${version}`;
+            btn.classList.toggle('active', version === defaultVersion);
+            versionControl.appendChild(btn);
+        });
+        
+        // A just-finished website has no version list yet; show its default version
+        const preview = item.querySelector('.website-preview');
+        const frameVersions = availableVersions.length ? availableVersions : [defaultVersion];
+        frameVersions.forEach(version => {
+            const iframe = previewFrameTemplate.content.firstElementChild.cloneNode(true);
+            iframe.dataset.version = version;
+            iframe.title = `Website Preview for ${website.identifier}, version ${version}`;
+            iframe.dataset.src = `/raw/${website.identifier}/${version}`;
+            iframe.classList.toggle('active', version === defaultVersion);
+            preview.appendChild(iframe);
+        });
+    } else {
+        item.querySelector('.version-control-list').remove();
+        item.querySelector('.website-preview').replaceWith(
+            processingPreviewTemplate.content.firstElementChild.cloneNode(true)
+        );
+    }
+    
+    return item;
+}
+
+// One delegated listener handles clicks for every website item
+websitesList.addEventListener('click', (event) => {
+    const target = event.target.closest('[data-action]');
+    if (!target) return;
+    
+    const identifier = target.closest('.website-item').dataset.identifier;
+    switch (target.dataset.action) {
+        case 'switch-version':
+            switchVersion(identifier, parseInt(target.dataset.version));
+            break;
+        case 'toggle':
+            toggleWebsiteItem(identifier);
+            break;
+        case 'open':
+            openWebsiteWithVersion(identifier);
+            break;
+        case 'header':
+            handleHeaderClick(identifier, event);
+            break;
+        // 'original' links open on their own; claiming the click keeps the header from toggling
+    }
+});
+
+// Switch version in list preview
+function switchVersion(identifier, version) {
+    const entry = itemIndex.get(identifier);
+    if (!entry || !entry.frames.length) return;
+    
+    // Each version keeps its own frame, so switching back never reloads a page
+    entry.frames.forEach(iframe => {
+        iframe.classList.toggle('active', parseInt(iframe.dataset.version) === version);
+    });
+    
+    // Update button states and store the active version in the data attribute
+    entry.item.dataset.activeVersion = version;
+    entry.versionBtns.forEach(btn => {
+        btn.classList.toggle('active', parseInt(btn.dataset.version) === version);
+    });
+}
+
+// Open website in new tab with the currently active version
+function openWebsiteWithVersion(identifier) {
+    const entry = itemIndex.get(identifier);
+    const activeVersion = entry ? entry.item.dataset.activeVersion : 1;
+    window.open(`/website/${identifier}#v${activeVersion}`, '_blank');
+}
+
+// Handle header click - entire header is clickable when collapsed
+function handleHeaderClick(identifier, event) {
+    if (!itemIndex.has(identifier)) return;
+    
+    const isExpanded = expandedId === identifier;
+    
+    // If expanded, only toggle when clicking the arrow area, not buttons/links
+    if (isExpanded) {
+        // Clicks on buttons and links are dispatched to their own actions
+        // If we get here and it's expanded, it means they clicked non-interactive area
+        // Don't do anything - let buttons handle their own clicks
+        return;
+    }
+    
+    // If collapsed, entire header is clickable - expand it
+    toggleWebsiteItem(identifier);
+}
+
+// Toggle website item expand/collapse with accordion behavior
+function toggleWebsiteItem(identifier) {
+    const entry = itemIndex.get(identifier);
+    if (!entry) return;
+    
+    const previousId = expandedId;
+    expandedId = previousId === identifier ? null : identifier;
+    
+    // Only the previously and newly expanded items change, in the next frame
+    requestAnimationFrame(() => {
+        if (previousId) {
+            itemIndex.get(previousId)?.item.classList.remove('expanded');
+        }
+        if (expandedId === identifier) {
+            entry.item.classList.add('expanded');
+        }
+    });
+}
+
+// Show empty state
+function showEmptyState() {
+    emptyState.classList.remove('hidden');
+    itemIndex.clear();
+    expandedId = null;
+    websitesList.innerHTML = '';
+    websitesContainer.classList.remove('show');
+}
+
+// Hide empty state
+function hideEmptyState() {
+    emptyState.classList.add('hidden');
+    websitesContainer.classList.add('show');
+}
+
+// Add new website to top of list
+function addNewWebsite(websiteData) {
+    // Mark as new for auto-expansion
+    websiteData.isNew = true;
+    
+    // Add to beginning of array
+    websites.unshift(websiteData);
+    
+    // Keep only 10 most recent
+    if (websites.length > 10) {
+        websites = websites.slice(0, 10);
+    }
+    
+    // Re-render (this will automatically expand the new item and close others)
+    renderWebsites();
+    
+    // Scroll to show the new expanded preview in the middle of the screen:
+    // measure in the next frame, scroll in the one after
+    requestAnimationFrame(() => {
+        const entry = itemIndex.get(websiteData.identifier);
+        if (!entry) return;
+        
+        const newWebsiteItem = entry.item;
+        
+        const rect = newWebsiteItem.getBoundingClientRect();
+        const itemHeight = newWebsiteItem.offsetHeight;
+        const viewportHeight = window.innerHeight;
+        const targetScrollTop = window.scrollY + rect.top - (viewportHeight / 2) + (itemHeight / 2);
+        
+        requestAnimationFrame(() => {
+            window.scrollTo({
+                top: targetScrollTop,
+                behavior: 'smooth'
+            });
+        });
+    });
+}
+
+form.addEventListener('submit', async (e) => {
+    e.preventDefault();
+    
+    // Check if demo checkbox is checked
+    const demoCheckbox = document.getElementById('demoCheckbox');
+    if (demoCheckbox && demoCheckbox.checked) {
+        // Show loading state
+        generateBtn.disabled = true;
+        generateBtn.className = 'btn loading';
+        generateBtn.innerHTML = '<span class="spinner"></span>Building modern website';
+        statusDiv.className = 'status show';
+        statusDiv.innerHTML = 'Generating demo website...';
+        
+        // Let the browser fetch the demo page while the spinner shows
+        const prefetch = document.createElement('link');
+        prefetch.rel = 'prefetch';
+        prefetch.href = '/demo';
+        document.head.appendChild(prefetch);
+        
+        // Go as soon as the demo is available, after a short minimum so the spinner registers
+        try {
+            const [response] = await Promise.all([
+                fetch('/demo-ready'),
+                new Promise(resolve => setTimeout(resolve, 2000))
+            ]);
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+            window.location.href = '/demo';
+        } catch (error) {
+            showError(`Demo website unavailable: ${error.message}`);
+            generateBtn.disabled = false;
+            generateBtn.textContent = 'Generate Optimized Website';
+        }
+        return;
+    }
+    
+    const url = urlInput.value.trim();
+    if (!url) return;
+    
+    // Reset UI
+    generateBtn.disabled = true;
+    generateBtn.className = 'btn loading';
+    generateBtn.innerHTML = '<span class="spinner"></span>Building modern website, this will take a minute or two';
+    statusDiv.className = 'status';
+    statusDiv.innerHTML = '';
+    resultDiv.className = 'result';
+    resultDiv.innerHTML = '';
+    
+    jobController?.abort();
+    jobController = new AbortController();
+    const signal = jobController.signal;
+    
+    try {
+        // Start generation
+        const response = await fetch('/generate', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ url: url }),
+            signal
+        });
+        
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        
+        const job = await response.json();
+        currentJobId = job.id;
+        
+        // Follow status updates
+        watchJobStatus(signal);
+        
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        showError(`Failed to start generation: ${error.message}`);
+        resetForm();
+    }
+});
+
+function watchJobStatus(signal) {
+    if (!currentJobId) return;
+    
+    // Follow pushed status updates; fall back to polling if the stream fails
+    // or the browser has no EventSource
+    if (!('EventSource' in window)) {
+        pollJobStatus(signal);
+        return;
+    }
+    
+    const jobId = currentJobId;
+    const events = new EventSource(`/events/${jobId}`);
+    signal.addEventListener('abort', () => events.close());
+    
+    events.onmessage = (event) => {
+        const job = JSON.parse(event.data);
+        if (job.status === 'completed' || job.status === 'failed') {
+            events.close();
+        }
+        
+        try {
+            handleJobStatus(job);
+        } catch (error) {
+            showError(`Status check failed: ${error.message}`);
+            resetForm();
+        }
+    };
+    
+    events.onerror = () => {
+        events.close();
+        if (!signal.aborted) {
+            pollJobStatus(signal);
+        }
+    };
+}
+
+// Failed status requests are retried with jittered delays doubling from 200ms up to a minute
+const POLL_RETRY_BASE_MS = 200;
+const POLL_RETRY_MAX_MS = 60000;
+const POLL_MAX_RETRIES = 9;
+
+// Single-character answers from /status/{id}/code
+const STATUS_BY_CODE = { p: 'pending', r: 'processing', c: 'completed', f: 'failed' };
+
+// Polls never go out closer together than this, even when the server answers at once
+const POLL_MIN_INTERVAL_MS = 200;
+let lastPollTs = 0;
+
+// Fallback when the event stream is unavailable: long-poll, so the server holds
+// each request until the job's status changes and no client-side delay is needed
+async function pollJobStatus(signal, lastStatus = null, failures = 0) {
+    // Nobody is watching a hidden tab; hold the next poll until it is shown again
+    await whenVisible();
+    const wait = lastPollTs + POLL_MIN_INTERVAL_MS - performance.now();
+    if (wait > 0) {
+        await new Promise(resolve => setTimeout(resolve, wait));
+    }
+    if (!currentJobId || signal.aborted) return;
+    lastPollTs = performance.now();
+    
+    let job;
+    try {
+        // Poll the one-character status; the full job is only needed once it ends
+        const query = lastStatus ? `?wait=25&status=${encodeURIComponent(lastStatus)}` : '';
+        const code = await (await fetchStatus(`/status/${currentJobId}/code${query}`, signal)).text();
+        const status = STATUS_BY_CODE[code];
+        if (status === 'pending' || status === 'processing') {
+            job = { status };
+        } else {
+            job = await (await fetchStatus(`/status/${currentJobId}`, signal)).json();
+        }
+        
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        if (error.retryable !== false && failures < POLL_MAX_RETRIES) {
+            const delay = Math.min(POLL_RETRY_MAX_MS, POLL_RETRY_BASE_MS * 2 ** failures);
+            setTimeout(pollJobStatus, delay / 2 + Math.random() * delay / 2, signal, lastStatus, failures + 1);
+            return;
+        }
+        showError(`Status check failed: ${error.message}`);
+        resetForm();
+        return;
+    }
+    
+    try {
+        handleJobStatus(job);
+    } catch (error) {
+        showError(`Status check failed: ${error.message}`);
+        resetForm();
+        return;
+    }
+    
+    // Continue polling if still processing
+    if (job.status === 'pending' || job.status === 'processing') {
+        pollJobStatus(signal, job.status);
+    }
+}
+
+// Fetch a status URL, marking whether a failure is worth retrying
+async function fetchStatus(url, signal) {
+    const response = await fetch(url, { signal });
+    if (!response.ok) {
+        const error = new Error(`HTTP ${response.status}: ${response.statusText}`);
+        // Server errors may clear up; anything else (like an unknown job) will not
+        error.retryable = response.status >= 500 || response.status === 429;
+        throw error;
+    }
+    return response;
+}
+
+// Resolves once the page is visible
+function whenVisible() {
+    if (!document.hidden) return Promise.resolve();
+    return new Promise(resolve => {
+        document.addEventListener('visibilitychange', function onVisibilityChange() {
+            if (document.hidden) return;
+            document.removeEventListener('visibilitychange', onVisibilityChange);
+            resolve();
+        });
+    });
+}
+
+function handleJobStatus(job) {
+    switch (job.status) {
+        case 'pending':
+        case 'processing':
+            // Keep button text as is, no status updates during processing
+            break;
+            
+        case 'completed':
+            statusDiv.className = 'status show';
+            statusDiv.innerHTML = 'Website created successfully!';
+            
+            // Add new website to the list (will appear in expanded view)
+            const newWebsiteData = {
+                id: job.website_id,
+                identifier: job.identifier,
+                original_url: urlInput.value.trim(),
+                created_at: new Date().toISOString(),
+                has_generated_html: true
+            };
+            addNewWebsite(newWebsiteData);
+            
+            resetForm();
+            break;
+            
+        case 'failed':
+            throw new Error(job.error_message || 'Generation failed');
+            
+        default:
+            throw new Error(`Unknown job status: ${job.status}`);
+    }
+}
+
+function showError(message) {
+    statusDiv.className = 'status show';
+    statusDiv.innerHTML = `Error: ${message}`;
+    generateBtn.className = 'btn';
+}
+
+function resetForm() {
+    // Cancels any status request still hanging for the finished job
+    jobController?.abort();
+    generateBtn.disabled = false;
+    generateBtn.className = 'btn';
+    generateBtn.textContent = 'Generate Optimized Website';
+    statusDiv.className = 'status';
+    statusDiv.innerHTML = '';
+    currentJobId = null;
+}
@@ -0,0 +1,48 @@
+// Handle version switching
+const versionButtons = document.querySelectorAll('.version-btn');
+const iframe = document.getElementById('website-frame');
+const identifier = document.body.dataset.identifier;
+
+// Load version from URL hash on page load
+function loadVersionFromHash() {
+    const hash = window.location.hash.substring(1); // Remove #
+    if (hash.startsWith('v')) {
+        const versionNum = parseInt(hash.substring(1));
+        if (versionNum >= 1 && versionNum <= 3) {
+            switchToVersion(versionNum);
+        }
+    }
+}
+
+function switchToVersion(versionNum) {
+    // Update iframe src
+    iframe.src = `/raw/${identifier}/${versionNum}`;
+
+    // Update button states
+    versionButtons.forEach(btn => {
+        const btnVersion = parseInt(btn.dataset.version);
+        if (btnVersion === versionNum) {
+            btn.classList.add('active');
+        } else {
+            btn.classList.remove('active');
+        }
+    });
+
+    // Update URL hash without reloading
+    window.location.hash = `v${versionNum}`;
+}
+
+// Add click handlers to version buttons
+versionButtons.forEach(button => {
+    button.addEventListener('click', () => {
+        if (button.disabled) return;
+        const version = parseInt(button.dataset.version);
+        switchToVersion(version);
+    });
+});
+
+// Load version from hash on initial load
+window.addEventListener('DOMContentLoaded', loadVersionFromHash);
+
+// Handle hash changes (browser back/forward)
+window.addEventListener('hashchange', loadVersionFromHash);
@@ -1,36 +1,46 @@
 -- Database initialization script for Website Generator
 -- This script creates the websites table with proper schema and indexes
 
--- Create extension for UUID generation
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
-
 -- Create websites table
 CREATE TABLE IF NOT EXISTS websites (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     identifier VARCHAR(100) NOT NULL UNIQUE,
     original_url TEXT NOT NULL,
-    original_html TEXT,
+    -- Scraped pages are large and only written once; lz4 compresses them much faster
+    -- than pglz (existing databases are switched by the startup migrations)
+    original_html TEXT COMPRESSION lz4,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 -- Create indexes for performance
-CREATE INDEX IF NOT EXISTS idx_websites_identifier ON websites(identifier);
+-- (identifier lookups use the unique index backing the UNIQUE constraint above)
 CREATE INDEX IF NOT EXISTS idx_websites_original_url ON websites(original_url);
-CREATE INDEX IF NOT EXISTS idx_websites_created_at ON websites(created_at DESC);
+-- Prefix (LIKE 'base%') scans when picking a free identifier; the unique index
+-- above uses the database collation and can't serve LIKE unless it is "C"
+CREATE INDEX IF NOT EXISTS idx_websites_identifier_pattern ON websites(identifier varchar_pattern_ops);
+-- Index for the recent-websites list; only the bounded columns are included, as
+-- original_url is unbounded TEXT and its few heap fetches are cheap at LIMIT 10
+CREATE INDEX IF NOT EXISTS idx_websites_created_recent
+    ON websites(created_at DESC) INCLUDE (id, identifier);
 
 -- Create website_versions table to store multiple generated versions
 CREATE TABLE IF NOT EXISTS website_versions (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     website_id UUID NOT NULL REFERENCES websites(id) ON DELETE CASCADE,
     version_number INTEGER NOT NULL CHECK (version_number IN (1, 2, 3)),
     generation_instructions TEXT NOT NULL,
     generated_html TEXT,
+    html_sha256 CHAR(64),
+    html_gzip BYTEA,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     UNIQUE(website_id, version_number)
 );
 
+-- Columns added after the first release are also applied to existing
+-- databases by the startup migrations in backend/database.py
+
 -- Create indexes for website_versions
 CREATE INDEX IF NOT EXISTS idx_website_versions_website_id ON website_versions(website_id);
 CREATE INDEX IF NOT EXISTS idx_website_versions_version_number ON website_versions(version_number);
@@ -38,7 +48,7 @@ CREATE INDEX IF NOT EXISTS idx_website_versions_created_at ON website_versions(c
 
 -- Create jobs table for async processing
 CREATE TABLE IF NOT EXISTS jobs (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     website_id UUID REFERENCES websites(id) ON DELETE CASCADE,
     status VARCHAR(50) NOT NULL DEFAULT 'pending',
     error_message TEXT,
@@ -52,7 +62,7 @@ CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at DESC);
 
 -- Create image_mappings table for Cloudinary URL mappings
 CREATE TABLE IF NOT EXISTS image_mappings (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     website_id UUID REFERENCES websites(id) ON DELETE CASCADE,
     original_url TEXT NOT NULL,
     cloudinary_url TEXT NOT NULL,
@@ -61,7 +71,11 @@ CREATE TABLE IF NOT EXISTS image_mappings (
 );
 
 -- Create index on image_mappings
-CREATE INDEX IF NOT EXISTS idx_image_mappings_website_id ON image_mappings(website_id);
+-- (serves both the URL map lookup and the ordered image listing; the URL and
+-- alt text columns are unbounded, so they stay in the heap rather than the index)
+DROP INDEX IF EXISTS idx_image_mappings_website_id;
+CREATE INDEX IF NOT EXISTS idx_image_mappings_website_created
+    ON image_mappings(website_id, created_at);
 
 -- Function to automatically update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -73,17 +87,18 @@ END;
 $$ language 'plpgsql';
 
 -- Create triggers for automatic timestamp updates
-CREATE TRIGGER update_websites_updated_at 
+-- (UPDATE statements in the application rely on these and do not set updated_at)
+CREATE OR REPLACE TRIGGER update_websites_updated_at 
     BEFORE UPDATE ON websites 
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_website_versions_updated_at 
+CREATE OR REPLACE TRIGGER update_website_versions_updated_at 
     BEFORE UPDATE ON website_versions 
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_jobs_updated_at 
+CREATE OR REPLACE TRIGGER update_jobs_updated_at 
     BEFORE UPDATE ON jobs 
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();